@@ -0,0 +1,438 @@
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+import day_01
+import day_02
+import day_02_alt
+import day_03
+import day_04
+import day_05
+import day_06
+import day_07
+import day_08
+import day_09
+import day_10
+from constants import INPUTS_DIR, UTF_8
+from input_loader import iter_blocks, iter_lines, read_text
+from runner import PartResult, day_spec, discover_days, read_input, run_day, select_days
+
+BASELINE_PATH = Path("benchmark_baseline.json")
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_THRESHOLD = 0.2  # flag anything more than 20% slower than its baseline
+DEFAULT_REPEAT = 3
+
+# run in a fresh interpreter, so nothing the module imports is already loaded
+STARTUP_SCRIPT = "import time; start = time.perf_counter(); import {name}; print(time.perf_counter() - start)"
+
+# (real input text, scale factor) -> an equivalent-shaped input roughly `scale` times bigger
+Scaler = Callable[[str, int], str]
+
+
+def _repeat_lines(raw: str, scale: int) -> str:
+    return "\n".join([raw.strip()] * scale) + "\n"
+
+
+def _repeat_blocks(raw: str, scale: int) -> str:
+    return "\n\n".join([raw.strip()] * scale) + "\n"
+
+
+def _scale_day_05(raw: str, scale: int) -> str:
+    # running the moves forward and then their inverses in reverse order restores the starting stacks
+    # (for both crane models), so round trips can be prepended to the real instructions
+    start_config, instructions = raw.rstrip("\n").split("\n\n")
+    lines = instructions.split("\n")
+    inverses = []
+    for line in reversed(lines):
+        _, count, _, start, _, end = line.split()
+        inverses.append(f"move {count} from {end} to {start}")
+    round_trips = (lines + inverses) * ((scale - 1) // 2)
+    return start_config + "\n\n" + "\n".join(round_trips + lines) + "\n"
+
+
+def _scale_day_06(raw: str, scale: int) -> str:
+    # a long run with only 3 distinct characters can't hold a marker, so the search has to scan past it
+    data = raw.strip()
+    return "abc" * (len(data) * (scale - 1) // 3) + data + "\n"
+
+
+def _scale_day_07(raw: str, scale: int) -> str:
+    # replay the whole transcript inside `scale - 1` extra subdirectories of the root
+    lines = raw.strip().split("\n")
+    out = list(lines)
+    for copy_index in range(scale - 1):
+        copy_name = f"copy{copy_index}"
+        out.extend(["$ cd /", "$ ls", f"dir {copy_name}"])
+        for line in lines:
+            out.append(line)
+            if line == "$ cd /":
+                out.append(f"$ cd {copy_name}")
+    return "\n".join(out) + "\n"
+
+
+def _scale_day_18(raw: str, scale: int) -> str:
+    # disjoint copies of the blob, side by side along x
+    points = [tuple(map(int, line.split(","))) for line in raw.strip().split("\n")]
+    width = 2 + max(x for x, _, _ in points) - min(x for x, _, _ in points)
+    return "\n".join(
+        f"{x + copy_index * width},{y},{z}"
+        for copy_index in range(scale)
+        for x, y, z in points
+    ) + "\n"
+
+
+SCALERS: Dict[str, Scaler] = {
+    "day_01": _repeat_blocks,
+    "day_02": _repeat_lines,
+    "day_02_alt": _repeat_lines,
+    "day_03": _repeat_lines,
+    "day_04": _repeat_lines,
+    "day_05": _scale_day_05,
+    "day_06": _scale_day_06,
+    "day_07": _scale_day_07,
+    "day_08": _repeat_lines,
+    "day_09": _repeat_lines,
+    "day_10": _repeat_lines,
+    "day_18": _scale_day_18,
+}
+
+
+# (input file) -> answers; every engine of a day must agree. Each one includes its own reading and parsing
+Engine = Callable[[Path], Any]
+
+
+def _day_01_lists(path: Path) -> Tuple[int, int]:
+    blocks = day_01.parse(read_text(path))
+    return day_01.main(blocks, top_k=1), day_01.main(blocks, top_k=3)
+
+
+def _day_01_stream(path: Path) -> Tuple[int, int]:
+    tops = day_01.main_stream(iter_blocks(path), top_ks=(1, 3))
+    return tops[1], tops[3]
+
+
+def _day_01_numpy(path: Path) -> Tuple[int, int]:
+    tops = day_01.main_array(*day_01.parse_array(read_text(path)), top_ks=(1, 3))
+    return tops[1], tops[3]
+
+
+def _day_02_rounds(path: Path) -> List[Tuple[str, str]]:
+    return [cast(Tuple[str, str], tuple(line.split())) for line in iter_lines(path)]
+
+
+def _day_02_branches(path: Path) -> Tuple[int, int]:
+    rounds = _day_02_rounds(path)
+    return day_02.main1(rounds), day_02.main2(rounds)
+
+
+def _day_02_index(path: Path) -> Tuple[int, int]:
+    rounds = _day_02_rounds(path)
+    return day_02_alt.main1(rounds), day_02_alt.main2(rounds)
+
+
+def _day_04_loops(path: Path) -> Tuple[int, int]:
+    pairs = day_04.parse(list(iter_lines(path)))
+    return day_04.main1(pairs), day_04.main2(pairs)
+
+
+def _day_05_parsed(path: Path) -> Tuple[str, str]:
+    cols, instructions = day_05.parse(*iter_blocks(path))
+    return "".join(day_05.main1(cols, instructions)), "".join(day_05.main2(cols, instructions))
+
+
+def _day_05_stream(path: Path) -> Tuple[str, str]:
+    tops1, tops2 = day_05.main_stream(path)
+    return "".join(tops1), "".join(tops2)
+
+
+def _day_06_sets(path: Path) -> Tuple[int, int]:
+    data = read_text(path).strip()
+    return day_06.main(data, 4), day_06.main(data, 14)
+
+
+def _day_06_stream(path: Path) -> Tuple[int, int]:
+    with open(path, "r", encoding=UTF_8) as f:
+        markers = day_06.main_stream(f, (4, 14))
+    return markers[4], markers[14]
+
+
+def _day_06_numpy(path: Path) -> Tuple[int, int]:
+    markers = day_06.main_numpy(path.read_bytes(), (4, 14))
+    return int(markers[4][0]), int(markers[14][0])
+
+
+def _day_07_recursive(path: Path) -> Tuple[int, int]:
+    ans, root = day_07.main1(list(iter_lines(path)))
+    return ans, day_07.main2(root)
+
+
+def _day_07_tree(path: Path) -> Tuple[int, int]:
+    fs = day_07.build_filesystem(iter_lines(path))
+    return day_07.main1_tree(fs), day_07.main2_tree(fs)
+
+
+def _day_07_table(path: Path) -> Tuple[int, int]:
+    totals = day_07.DirTable.from_transcript(iter_lines(path)).total_sizes()
+    return day_07.main1_table(totals), day_07.main2_table(totals)
+
+
+def _day_08_loops(path: Path) -> Tuple[int, int]:
+    forest = [list(map(int, line)) for line in iter_lines(path)]
+    return int(day_08.main1(forest)), day_08.main2(forest)
+
+
+def _day_08_numpy(path: Path) -> Tuple[int, int]:
+    grid = day_08.parse_grid(path.read_bytes())
+    return day_08.main1_numpy(grid), day_08.main2_stack(grid)
+
+
+def _day_09_steps(path: Path) -> List[Tuple[str, int]]:
+    return [(direction, int(count)) for direction, count in (line.split() for line in iter_lines(path) if line != "")]
+
+
+def _day_09_knots(path: Path) -> Tuple[int, int]:
+    steps = _day_09_steps(path)
+    return day_09.main(steps, n_knots=2), day_09.main(steps, n_knots=10)
+
+
+def _day_09_array(path: Path) -> Tuple[int, int]:
+    steps = _day_09_steps(path)
+    return day_09.main_array(steps, n_knots=2), day_09.main_array(steps, n_knots=10)
+
+
+def _day_09_lengths(path: Path) -> Tuple[int, int]:
+    counts = day_09.main_lengths(_day_09_steps(path), (2, 10))
+    return counts[2], counts[10]
+
+
+def _day_10_interpreter(path: Path) -> Tuple[int, List[List[str]]]:
+    return day_10.main(iter_lines(path))
+
+
+def _day_10_numpy(path: Path) -> Tuple[int, List[List[str]]]:
+    return day_10.main_numpy(iter_lines(path))
+
+
+ENGINES: Dict[str, Dict[str, Engine]] = {
+    "day_01": {
+        "lists": _day_01_lists,
+        "stream": _day_01_stream,
+        "numpy": _day_01_numpy,
+    },
+    "day_02": {
+        "branches": _day_02_branches,
+        "alt index": _day_02_index,
+        "table count": lambda path: day_02.main_table(path.read_bytes()),
+        "table numpy": lambda path: day_02.main_table_numpy(path.read_bytes()),
+    },
+    "day_03": {
+        "sets": lambda path: (day_03.main1(list(iter_lines(path))), day_03.main2(list(iter_lines(path)))),
+        "bitmask": lambda path: (day_03.main1_bits(list(iter_lines(path))), day_03.main2_bits(list(iter_lines(path)))),
+    },
+    "day_04": {
+        "loops": _day_04_loops,
+        "numpy": lambda path: day_04.main_numpy(day_04.parse_numpy(read_text(path))),
+    },
+    "day_05": {
+        "parsed": _day_05_parsed,
+        "stream": _day_05_stream,
+    },
+    "day_06": {
+        "sets": _day_06_sets,
+        "stream": _day_06_stream,
+        "numpy": _day_06_numpy,
+    },
+    "day_07": {
+        "recursive": _day_07_recursive,
+        "tree": _day_07_tree,
+        "table": _day_07_table,
+    },
+    "day_08": {
+        "loops": _day_08_loops,
+        "numpy": _day_08_numpy,
+    },
+    "day_09": {
+        "knots": _day_09_knots,
+        "array": _day_09_array,
+        "one pass": _day_09_lengths,
+    },
+    "day_10": {
+        "interpreter": _day_10_interpreter,
+        "numpy": _day_10_numpy,
+    },
+}
+
+
+def make_input(name: str, scale: int, inputs_dir: Path = Path(INPUTS_DIR)) -> str:
+    raw = read_input(day_spec(name), inputs_dir)
+    if scale == 1:
+        return raw
+    return SCALERS[name](raw, scale)
+
+
+def bench_key(day: str, part: str, scale: int) -> str:
+    return f"{day}/{part}@x{scale}"
+
+
+def bench_day(
+        name: str,
+        scale: int,
+        *,
+        repeat: int = DEFAULT_REPEAT,
+        inputs_dir: Path = Path(INPUTS_DIR),
+) -> Dict[str, float]:
+    # best of `repeat` runs for parse and every part
+    raw = make_input(name, scale, inputs_dir)
+    best: Dict[str, float] = {}
+    for _ in range(repeat):
+        results: List[PartResult] = run_day(name, raw=raw, trace_memory=False)
+        for result in results:
+            key = bench_key(result.day, result.part, scale)
+            best[key] = min(best.get(key, float("inf")), result.seconds)
+    return best
+
+
+def engine_key(day: str, engine: str, scale: int) -> str:
+    return f"{day}/engine:{engine}@x{scale}"
+
+
+def bench_engines(
+        name: str,
+        scale: int,
+        *,
+        repeat: int = DEFAULT_REPEAT,
+        inputs_dir: Path = Path(INPUTS_DIR),
+) -> Dict[str, float]:
+    # engines read from a file, so the (possibly generated) input is written out first
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / day_spec(name).input_file
+        with open(path, "w", encoding=UTF_8) as f:
+            f.write(make_input(name, scale, inputs_dir))
+        best: Dict[str, float] = {}
+        answers: Dict[str, Any] = {}
+        for engine_name, engine in ENGINES[name].items():
+            for _ in range(repeat):
+                start = time.perf_counter()
+                answers[engine_name] = engine(path)
+                seconds = time.perf_counter() - start
+                key = engine_key(name, engine_name, scale)
+                best[key] = min(best.get(key, float("inf")), seconds)
+    if len(set(map(repr, answers.values()))) > 1:
+        raise RuntimeError(f"{name} engines disagree at scale {scale}: {answers}")
+    return best
+
+
+def startup_key(day: str) -> str:
+    return f"{day}/import@cold"
+
+
+def bench_startup(name: str, *, repeat: int = DEFAULT_REPEAT) -> Dict[str, float]:
+    # best of `repeat` cold imports of the module, excluding interpreter start-up itself
+    best = float("inf")
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT.format(name=name)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        best = min(best, float(proc.stdout))
+    return {startup_key(name): best}
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, float]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding=UTF_8) as f:
+        return json.load(f)
+
+
+def save_baseline(timings: Dict[str, float], path: Path = BASELINE_PATH):
+    baseline = load_baseline(path)
+    baseline.update(timings)
+    with open(path, "w", encoding=UTF_8) as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def find_regressions(
+        timings: Dict[str, float],
+        baseline: Dict[str, float],
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        min_seconds: float = 0.001,
+) -> List[str]:
+    # timings under `min_seconds` are too noisy to compare
+    return [
+        key
+        for key, seconds in timings.items()
+        if key in baseline
+        and max(seconds, baseline[key]) >= min_seconds
+        and seconds > baseline[key] * (1 + threshold)
+    ]
+
+
+def format_report(timings: Dict[str, float], baseline: Dict[str, float], regressions: List[str]) -> str:
+    rows = [("benchmark", "time (s)", "baseline (s)", "change")]
+    for key, seconds in timings.items():
+        if key in baseline:
+            base = f"{baseline[key]:.4f}"
+            change = f"{(seconds / baseline[key] - 1) * 100:+.1f}%" if baseline[key] > 0 else "-"
+        else:
+            base = change = "-"
+        if key in regressions:
+            change += "  REGRESSION"
+        rows.append((key, f"{seconds:.4f}", base, change))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the day modules against stored baselines")
+    parser.add_argument("days", nargs="*", help="day numbers (e.g. 7) or module names (e.g. day_16b); default all")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                        help="input scale factors; days without a generator only run at scale 1")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per benchmark; the best is kept")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown that counts as a regression")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="store these timings as the new baseline")
+    parser.add_argument("--startup", action="store_true", help="benchmark cold module imports instead of solving")
+    parser.add_argument("--engines", action="store_true",
+                        help="compare the alternative engines of each day (that has them) instead of its parts")
+    parser.add_argument("--inputs-dir", type=Path, default=Path(INPUTS_DIR))
+    args = parser.parse_args(argv)
+    available = discover_days()
+    names = available if len(args.days) == 0 else select_days(args.days, available)
+    timings: Dict[str, float] = {}
+    for name in names:
+        if args.startup:
+            timings.update(bench_startup(name, repeat=args.repeat))
+            continue
+        if args.engines and name not in ENGINES:
+            continue
+        for scale in args.scales:
+            if scale != 1 and name not in SCALERS:
+                continue
+            if args.engines:
+                timings.update(bench_engines(name, scale, repeat=args.repeat, inputs_dir=args.inputs_dir))
+            else:
+                timings.update(bench_day(name, scale, repeat=args.repeat, inputs_dir=args.inputs_dir))
+    baseline = load_baseline(args.baseline)
+    regressions = find_regressions(timings, baseline, threshold=args.threshold)
+    print(format_report(timings, baseline, regressions))
+    if args.save:
+        save_baseline(timings, args.baseline)
+    if len(regressions) > 0:
+        print(f"{len(regressions)} regression(s) past {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
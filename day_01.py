@@ -1,8 +1,15 @@
+from __future__ import annotations
+
 import bisect
+import heapq
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from constants import INPUTS_DIR
+from input_loader import read_text
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+np = lazy_module("numpy")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-01.txt"
 
@@ -30,11 +37,60 @@ def main(blocks: List[List[int]], top_k: int = 1) -> int:
     return sum(tops)
 
 
+def parse_array(input_raw: str) -> Tuple[np.ndarray, np.ndarray]:
+    # every count in one flat array, plus the index where each elf's block starts;
+    # blank lines become a 0 at the end of the block before them, which doesn't change its sum
+    values = np.fromstring(input_raw.strip().replace("\n\n", "\n-1\n"), dtype=np.int64, sep="\n")
+    separators = np.flatnonzero(values == -1)
+    values[separators] = 0
+    starts = np.concatenate(([0], separators + 1))
+    return values, starts
+
+
+def main_array(values: np.ndarray, starts: np.ndarray, top_ks: Iterable[int] = (1,)) -> Dict[int, int]:
+    top_ks = sorted(set(top_ks))
+    if len(top_ks) == 0:
+        raise ValueError("top_ks must name at least one k")
+    elf_counts = np.add.reduceat(values, starts)
+    k_max = min(top_ks[-1], len(elf_counts))
+    if k_max == 0:
+        return {k: 0 for k in top_ks}
+    # only the biggest k_max need sorting
+    tops = np.sort(np.partition(elf_counts, len(elf_counts) - k_max)[-k_max:])[::-1]
+    return {k: int(tops[:k].sum()) for k in top_ks}
+
+
+def main_stream(blocks: Iterable[str], top_ks: Iterable[int] = (1,)) -> Dict[int, int]:
+    # one pass over lazily-read blocks (e.g. `iter_blocks(path)`), holding only the `max(top_ks)` biggest totals
+    top_ks = sorted(set(top_ks))
+    if len(top_ks) == 0:
+        raise ValueError("top_ks must name at least one k")
+    k_max = top_ks[-1]
+    tops: List[int] = []  # min-heap
+    for block in blocks:
+        count = sum(map(int, block.split()))
+        if k_max == 0:
+            continue  # nothing to keep, but still read (and validate) every block
+        if len(tops) < k_max:
+            heapq.heappush(tops, count)
+        elif count > tops[0]:
+            heapq.heapreplace(tops, count)
+    tops.sort(reverse=True)
+    return {k: sum(tops[:k]) for k in top_ks}
+
+
+def parse_input(raw: str) -> List[List[int]]:
+    return parse(raw)
+
+
+PARTS: Dict[str, Callable[[List[List[int]], Dict[str, Any]], Any]] = {
+    "1 elf": lambda blocks, _: main(blocks, top_k=1),
+    "3 elves": lambda blocks, _: main(blocks, top_k=3),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        input_raw_ = f.read()
-    blocks_ = parse(input_raw_)
-    ans = main(blocks_, top_k=1)
-    print("1 elf:", ans)
-    ans = main(blocks_, top_k=3)
-    print("3 elves:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
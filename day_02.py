@@ -1,7 +1,11 @@
 from pathlib import Path
-from typing import List, Tuple, cast
+from typing import Any, Callable, Dict, List, Tuple, cast
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
+
+np = lazy_module("numpy")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-02.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -103,17 +107,59 @@ def main2(lines: List[Tuple[str, str]]) -> int:
     return total
 
 
+ORDER_THEM = (ROCK_IN, PAPER_IN, SCISSORS_IN)
+ORDER_ME = (ROCK_OUT, PAPER_OUT, SCISSORS_OUT)
+
+# score of every possible round for each part, (them, me) -> score
+SCORES_1: Dict[Tuple[str, str], int] = {
+    (them, me): main1([(them, me)])
+    for them in ORDER_THEM
+    for me in ORDER_ME
+}
+SCORES_2: Dict[Tuple[str, str], int] = {
+    (them, me): main2([(them, me)])
+    for them in ORDER_THEM
+    for me in ORDER_ME
+}
+
+
+def main_table(data: bytes) -> Tuple[int, int]:
+    # counts each of the 9 possible rounds straight from the raw file contents
+    total1 = 0
+    total2 = 0
+    for (them, me), score1 in SCORES_1.items():
+        n_rounds = data.count(f"{them} {me}".encode())
+        total1 += n_rounds * score1
+        total2 += n_rounds * SCORES_2[(them, me)]
+    return total1, total2
+
+
+def main_table_numpy(data: bytes) -> Tuple[int, int]:
+    # the letters for "them" and "me" come from disjoint ranges, so each can be picked out of the buffer in order
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    them = buffer[(buffer >= ord(ORDER_THEM[0])) & (buffer <= ord(ORDER_THEM[-1]))].astype(np.intp) - ord(ORDER_THEM[0])
+    me = buffer[(buffer >= ord(ORDER_ME[0])) & (buffer <= ord(ORDER_ME[-1]))].astype(np.intp) - ord(ORDER_ME[0])
+    if len(them) != len(me):
+        raise ValueError(f"mismatched rounds: {len(them)} values for 'them' but {len(me)} for 'me'")
+    round_counts = np.bincount(them * len(ORDER_ME) + me, minlength=len(ORDER_THEM) * len(ORDER_ME))
+    table1 = np.array([SCORES_1[(t, m)] for t in ORDER_THEM for m in ORDER_ME])
+    table2 = np.array([SCORES_2[(t, m)] for t in ORDER_THEM for m in ORDER_ME])
+    return int(round_counts @ table1), int(round_counts @ table2)
+
+
+def parse_input(raw: str) -> List[Tuple[str, str]]:
+    # one cast for the whole list; subscripting `Tuple[str, str]` per line would dominate the parse
+    return cast(List[Tuple[str, str]], [tuple(line.split()) for line in split_lines(raw)])
+
+
+PARTS: Dict[str, Callable[[List[Tuple[str, str]], Dict[str, Any]], Any]] = {
+    "part 1": lambda rounds, _: main1(rounds),
+    "part 2": lambda rounds, _: main2(rounds),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = f.readlines()
-    lines_ = [
-        cast(
-            Tuple[str, str],
-            tuple(line_.strip().split())
-        )
-        for line_ in lines_
-    ]
-    ans = main1(lines_)
-    print("part 1:", ans)
-    ans = main2(lines_)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
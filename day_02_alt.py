@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import List, Tuple, cast
+from typing import Any, Callable, Dict, List, Tuple, cast
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-02.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -30,17 +31,19 @@ def main2(lines: List[Tuple[str, str]]) -> int:
     return total
 
 
+def parse_input(raw: str) -> List[Tuple[str, str]]:
+    # one cast for the whole list; subscripting `Tuple[str, str]` per line would dominate the parse
+    return cast(List[Tuple[str, str]], [tuple(line.split()) for line in split_lines(raw)])
+
+
+PARTS: Dict[str, Callable[[List[Tuple[str, str]], Dict[str, Any]], Any]] = {
+    "part 1": lambda rounds, _: main1(rounds),
+    "part 2": lambda rounds, _: main2(rounds),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = f.readlines()
-    lines_ = [
-        cast(
-            Tuple[str, str],
-            tuple(line_.strip().split())
-        )
-        for line_ in lines_
-    ]
-    ans = main1(lines_)
-    print("part 1:", ans)
-    ans = main2(lines_)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,7 +1,15 @@
+from __future__ import annotations
+
+import functools
+import string
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List
+
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+np = lazy_module("numpy")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-03.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -34,10 +42,60 @@ def main2(lines: List[str]) -> int:
     return total
 
 
+@functools.cache
+def item_bit_table() -> np.ndarray:
+    # byte value -> its item's bit; each item type gets the bit `priority - 1`,
+    # so the lowest set bit of a mask gives the lowest priority in it
+    table = np.zeros(256, dtype=np.uint64)
+    for c in string.ascii_letters:
+        table[ord(c)] = 1 << (priority(c) - 1)
+    return table
+
+
+def to_masks(item_lists: List[str]) -> np.ndarray:
+    # one 52-bit mask per (non-empty) string, all built with a single reduceat over the joined bytes
+    lengths = np.fromiter(map(len, item_lists), dtype=np.intp, count=len(item_lists))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    bits = item_bit_table()[np.frombuffer("".join(item_lists).encode(), dtype=np.uint8)]
+    return np.bitwise_or.reduceat(bits, starts)
+
+
+def mask_priorities(masks: np.ndarray) -> np.ndarray:
+    if not masks.all():
+        raise ValueError("no item in common")
+    lowest_bits = masks & (~masks + np.uint64(1))  # isolate the lowest set bit
+    return np.log2(lowest_bits).astype(np.int64) + 1  # exact, since the bits are powers of 2 below 2**53
+
+
+def main1_bits(lines: List[str]) -> int:
+    halves = []
+    for line in lines:
+        half = len(line) // 2
+        halves.append(line[:half])
+        halves.append(line[half:])
+    masks = to_masks(halves)
+    return int(mask_priorities(masks[0::2] & masks[1::2]).sum())
+
+
+def main2_bits(lines: List[str], group_size: int = 3) -> int:
+    if len(lines) % group_size != 0:
+        raise ValueError(f"{len(lines)} rucksacks can't be split into groups of {group_size}")
+    masks = to_masks(lines).reshape(-1, group_size)
+    return int(mask_priorities(np.bitwise_and.reduce(masks, axis=1)).sum())
+
+
+def parse_input(raw: str) -> List[str]:
+    return split_lines(raw)
+
+
+PARTS: Dict[str, Callable[[List[str], Dict[str, Any]], Any]] = {
+    "part 1": lambda lines, _: main1(lines),
+    "part 2": lambda lines, _: main2(lines),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    ans = main1(lines_)
-    print("part 1:", ans)
-    ans = main2(lines_)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,8 +1,15 @@
+from __future__ import annotations
+
+import bisect
 import re
 from pathlib import Path
-from typing import List, Tuple, cast
+from typing import Any, Callable, Dict, List, Tuple, Union, cast
+
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+np = lazy_module("numpy")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-04.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -21,6 +28,12 @@ def parse(lines: List[str]) -> List[Tuple[int, int, int, int]]:
     ]
 
 
+def parse_numpy(input_raw: str) -> np.ndarray:
+    # (n, 4) array of the same values `parse` gives, without any per-line Python work
+    values = np.fromstring(input_raw.strip().replace("-", ",").replace("\n", ","), dtype=np.int64, sep=",")
+    return values.reshape(-1, 4)
+
+
 def main1(lines: List[Tuple[int, int, int, int]]):
     count = 0
     for first_start, first_end, second_start, second_end in lines:
@@ -33,19 +46,77 @@ def main1(lines: List[Tuple[int, int, int, int]]):
 def main2(lines: List[Tuple[int, int, int, int]]):
     count = 0
     for first_start, first_end, second_start, second_end in lines:
-        if len(
-                set(range(first_start, first_end + 1))
-                & set(range(second_start, second_end + 1))
-        ) > 0:
+        if first_start <= second_end and second_start <= first_end:
             count += 1
     return count
 
 
+def main_numpy(lines: Union[np.ndarray, List[Tuple[int, int, int, int]]]) -> Tuple[int, int]:
+    # both parts for the whole file at once; takes the output of either `parse` or `parse_numpy`
+    ranges = np.asarray(lines, dtype=np.int64).reshape(-1, 4)
+    first_start, first_end, second_start, second_end = ranges.T
+    contained = ((first_start <= second_start) & (first_end >= second_end)) \
+        | ((second_start <= first_start) & (second_end >= first_end))
+    overlapping = (first_start <= second_end) & (second_start <= first_end)
+    return int(contained.sum()), int(overlapping.sum())
+
+
+class IntervalIndex:
+    # every assignment (2 per line) as an inclusive range; assignment `i` belongs to line `i // 2`
+    def __init__(self, lines: List[Tuple[int, int, int, int]]):
+        self.ranges: List[Tuple[int, int]] = []
+        for first_start, first_end, second_start, second_end in lines:
+            self.ranges.append((first_start, first_end))
+            self.ranges.append((second_start, second_end))
+        self._starts = sorted(start for start, _ in self.ranges)
+        self._ends = sorted(end for _, end in self.ranges)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def coverage(self, section: int) -> int:
+        # number of assignments covering `section`: those started by it, minus those that already ended before it
+        return bisect.bisect_right(self._starts, section) - bisect.bisect_left(self._ends, section)
+
+    def overlapping_pairs(self) -> List[Tuple[int, int]]:
+        # sweep over the endpoints; each assignment overlaps exactly the ones still open when it starts
+        events = []
+        for i, (start, end) in enumerate(self.ranges):
+            events.append((start, 0, i))  # at equal positions starts come first, since ranges are inclusive
+            events.append((end, 1, i))
+        events.sort()
+        active = set()
+        pairs = []
+        for _, is_end, i in events:
+            if is_end:
+                active.remove(i)
+            else:
+                pairs.extend((min(i, j), max(i, j)) for j in active)
+                active.add(i)
+        return pairs
+
+    def overlapping_line_pairs(self) -> List[Tuple[int, int]]:
+        # pairs of distinct lines with any assignment of one overlapping any assignment of the other
+        line_pairs = {
+            (i // 2, j // 2)
+            for i, j in self.overlapping_pairs()
+            if i // 2 != j // 2
+        }
+        return sorted(line_pairs)
+
+
+def parse_input(raw: str) -> List[Tuple[int, int, int, int]]:
+    return parse(split_lines(raw))
+
+
+PARTS: Dict[str, Callable[[List[Tuple[int, int, int, int]], Dict[str, Any]], Any]] = {
+    "total overlap": lambda pairs, _: main1(pairs),
+    "partial overlap": lambda pairs, _: main2(pairs),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    lines_ = parse(lines_)
-    ans = main1(lines_)
-    print("total overlap:", ans)
-    ans = main2(lines_)
-    print("partial overlap:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
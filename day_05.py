@@ -1,20 +1,16 @@
-import copy
 import re
 from collections import OrderedDict
 from pathlib import Path
-from typing import List, Tuple, cast
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set, Tuple, cast
 
 from constants import INPUTS_DIR, UTF_8
+from input_loader import iter_byte_lines, read_text
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-05.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
 
 
-def parse(
-        start_config: str,
-        instructions_block: str,
-) -> Tuple[OrderedDict[int, List[str]], List[Tuple[int, int, int]]]:
-    # top chunk
+def parse_stacks(start_config: str) -> OrderedDict[int, List[str]]:
     start_config = start_config.split("\n")
     cols = OrderedDict()
     for match in re.finditer(r"\d+", start_config[-1]):
@@ -31,7 +27,14 @@ def parse(
                 break
             this_col.append(sym)
         cols[col] = this_col
-    # bottom chunk
+    return cols
+
+
+def parse(
+        start_config: str,
+        instructions_block: str,
+) -> Tuple[OrderedDict[int, List[str]], List[Tuple[int, int, int]]]:
+    cols = parse_stacks(start_config)
     instructions = [
         cast(
             Tuple[int, int, int],
@@ -42,29 +45,102 @@ def parse(
     return cols, instructions
 
 
-def main1(cols: OrderedDict[int, List[str]], instructions: List[Tuple[int, int, int]]) -> List[str]:
-    cols = copy.deepcopy(cols)
+class CrateStacks:
+    # copy-on-write view of the parsed stacks: a stack is only copied the first time a move touches it,
+    # so the caller's stacks stay untouched without deep-copying all of them up front
+    def __init__(self, cols: OrderedDict[int, List[str]]):
+        self._cols = OrderedDict(cols)
+        self._owned: Set[int] = set()
+
+    def _writable(self, col: int) -> List[str]:
+        if col not in self._owned:
+            self._cols[col] = list(self._cols[col])
+            self._owned.add(col)
+        return self._cols[col]
+
+    def move(self, count: int, start: int, end: int, *, one_at_a_time: bool):
+        # moving crates one at a time is the same as moving them all at once, upside down
+        if count < 0:
+            raise ValueError(f"can't move a negative number of crates ({count}) from stack {start}")
+        if count > len(self._cols[start]):
+            raise ValueError(f"can't move {count} crates from stack {start}; it only has {len(self._cols[start])}")
+        if count == 0 or start == end:
+            return  # `source[-0:]` would be the whole stack, and a stack moved onto itself ends up unchanged
+        source = self._writable(start)
+        dest = self._writable(end)
+        moved = source[-count:]
+        del source[-count:]
+        if one_at_a_time:
+            moved.reverse()
+        dest.extend(moved)
+
+    def tops(self) -> List[str]:
+        return [col[-1] for col in self._cols.values()]
+
+
+def run_crane(
+        cols: OrderedDict[int, List[str]],
+        instructions: Iterable[Tuple[int, int, int]],
+        *,
+        one_at_a_time: bool,
+) -> List[str]:
+    stacks = CrateStacks(cols)
     for count, start, end in instructions:
-        for i in range(count):
-            val = cols[start].pop()
-            cols[end].append(val)
-    return [col[-1] for col in cols.values()]
+        stacks.move(count, start, end, one_at_a_time=one_at_a_time)
+    return stacks.tops()
+
+
+def main1(cols: OrderedDict[int, List[str]], instructions: List[Tuple[int, int, int]]) -> List[str]:
+    return run_crane(cols, instructions, one_at_a_time=True)
 
 
 def main2(cols: OrderedDict[int, List[str]], instructions: List[Tuple[int, int, int]]) -> List[str]:
-    cols = copy.deepcopy(cols)
-    for count, start, end in instructions:
-        stack = cols[start][-count:]
-        del cols[start][-count:]
-        cols[end] += stack
-    return [col[-1] for col in cols.values()]
+    return run_crane(cols, instructions, one_at_a_time=False)
+
+
+def iter_instructions(lines: Iterable[bytes]) -> Iterator[Tuple[int, int, int]]:
+    # "move N from A to B" split on whitespace; `int` reads the byte tokens directly
+    for line in lines:
+        tokens = line.split()
+        if len(tokens) == 0:
+            continue
+        try:
+            _, count, _, start, _, end = tokens
+        except ValueError:
+            raise ValueError(f"bad instruction: {line!r}") from None
+        yield int(count), int(start), int(end)
+
+
+def main_stream(path: Path) -> Tuple[List[str], List[str]]:
+    # one read of the file; each instruction is applied to both crane models as soon as it's read
+    lines = iter_byte_lines(path, strip=False)
+    start_config = []
+    for line in lines:
+        if line.strip() == b"":
+            break
+        start_config.append(line.decode(UTF_8))
+    cols = parse_stacks("\n".join(start_config))
+    crane1 = CrateStacks(cols)
+    crane2 = CrateStacks(cols)
+    for count, start, end in iter_instructions(lines):
+        crane1.move(count, start, end, one_at_a_time=True)
+        crane2.move(count, start, end, one_at_a_time=False)
+    return crane1.tops(), crane2.tops()
+
+
+def parse_input(raw: str) -> Tuple[OrderedDict[int, List[str]], List[Tuple[int, int, int]]]:
+    start_config, instructions_block = raw.split("\n\n")
+    return parse(start_config, instructions_block)
+
+
+PARTS: Dict[str, Callable[[Tuple[OrderedDict[int, List[str]], List[Tuple[int, int, int]]], Dict[str, Any]], Any]] = {
+    "part 1": lambda parsed, _: "".join(main1(*parsed)),
+    "part 2": lambda parsed, _: "".join(main2(*parsed)),
+}
 
 
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        start_config_, instructions_block_ = f.read().split("\n\n")
-    cols_, instructions_ = parse(start_config_, instructions_block_)
-    ans = main1(cols_, instructions_)
-    print("part 1:", "".join(ans))
-    ans = main2(cols_, instructions_)
-    print("part 2:", "".join(ans))
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,10 +1,20 @@
+from __future__ import annotations
+
 from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Hashable, Iterable, Iterator, TextIO, Union
 
 from constants import INPUTS_DIR, UTF_8
+from input_loader import read_text
+from lazy_import import lazy_module
+
+np = lazy_module("numpy")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-06.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
 
+CHUNK_SIZE = 1 << 16
+LINE_BREAKS = {"\n", "\r", ord("\n"), ord("\r")}  # str chunks yield characters, bytes chunks yield ints
+
 
 def main(s: str, k: int) -> int:
     for i in range(len(s) - k):
@@ -13,10 +23,78 @@ def main(s: str, k: int) -> int:
     raise ValueError("no answer found")
 
 
+def iter_chunks(stream: Union[TextIO, BinaryIO, Iterable[Union[str, bytes]]], chunk_size: int = CHUNK_SIZE) \
+        -> Iterator[Union[str, bytes]]:
+    if hasattr(stream, "read"):
+        while len(chunk := stream.read(chunk_size)) > 0:
+            yield chunk
+    else:
+        yield from stream
+
+
+def main_stream(
+        stream: Union[TextIO, BinaryIO, Iterable[Union[str, bytes]]],
+        ks: Iterable[int] = (4, 14),
+        *,
+        chunk_size: int = CHUNK_SIZE,
+) -> Dict[int, int]:
+    # O(n) for every k at once: a window ending at i has no repeats iff it starts after the last repeat seen,
+    # so each k only needs where its repeat-free run starts. `stream` is a file object or an iterable of chunks
+    ks = sorted(set(ks))
+    last_seen: Dict[Hashable, int] = {}
+    run_start = 0  # start of the longest repeat-free run ending at the current character
+    markers: Dict[int, int] = {}
+    i = 0
+    for chunk in iter_chunks(stream, chunk_size):
+        for c in chunk:
+            if c in LINE_BREAKS:
+                continue
+            prev = last_seen.get(c, -1)
+            if prev >= run_start:
+                run_start = prev + 1
+            last_seen[c] = i
+            i += 1
+            run_length = i - run_start
+            while len(markers) < len(ks) and run_length >= ks[len(markers)]:
+                markers[ks[len(markers)]] = i
+            if len(markers) == len(ks):
+                return markers
+    missing = [k for k in ks if k not in markers]
+    raise ValueError(f"no answer found for k={missing}")
+
+
+def repeat_free_lengths(signal: np.ndarray) -> np.ndarray:
+    # for each position, the length of the longest window ending there with no repeated value
+    n = len(signal)
+    order = np.argsort(signal, kind="stable")  # positions grouped by value, in increasing order within a group
+    prev_same = np.full(n, -1, dtype=np.int64)
+    same_as_prev = signal[order[1:]] == signal[order[:-1]]
+    prev_same[order[1:][same_as_prev]] = order[:-1][same_as_prev]
+    run_starts = np.maximum.accumulate(prev_same + 1)
+    return np.arange(1, n + 1) - run_starts
+
+
+def main_numpy(data: Union[str, bytes], ks: Iterable[int] = (4, 14)) -> Dict[int, np.ndarray]:
+    # every marker position (same convention as `main`: the index just past the window) for each k
+    if isinstance(data, str):
+        data = data.encode(UTF_8)
+    signal = np.frombuffer(data.strip(), dtype=np.uint8)
+    lengths = repeat_free_lengths(signal)
+    return {k: np.flatnonzero(lengths >= k) + 1 for k in ks}
+
+
+def parse_input(raw: str) -> str:
+    return raw.strip()
+
+
+PARTS: Dict[str, Callable[[str, Dict[str, Any]], Any]] = {
+    "4 unique": lambda data, _: main(data, 4),
+    "14 unique": lambda data, _: main(data, 14),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        data = f.read().strip()
-    ans = main(data, 4)
-    print("4 unique:", ans)
-    ans = main(data, 14)
-    print("14 unique:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
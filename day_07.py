@@ -1,8 +1,12 @@
+import bisect
+import itertools
 import re
+from array import array
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple, Dict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-07.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -130,10 +134,203 @@ def main2(root: Dir) -> int:
     return min(d.size for d in dirs_big_enough)
 
 
+class TrackedDir:
+    def __init__(self, name: str, parent: Optional['TrackedDir'] = None):
+        self.name = name
+        self.parent = parent
+        self.files: Dict[str, int] = {}
+        self.dirs: Dict[str, 'TrackedDir'] = {}
+        self.size = 0  # total of everything below, kept current as files are added
+
+
+class FileSystem:
+    # keeps a pointer to the current directory instead of a path from the root, and keeps every directory's
+    # total size current as files are added; nothing here recurses, so tree depth isn't limited
+    def __init__(self):
+        self.root = TrackedDir("/")
+        self.cwd = self.root
+        self.all_dirs: List[TrackedDir] = [self.root]
+        self._sorted_sizes: Optional[List[int]] = None
+        self._prefix_sums: List[int] = []
+
+    def cd(self, name: str):
+        if name == "/":
+            self.cwd = self.root
+        elif name == "..":
+            if self.cwd.parent is None:
+                raise ValueError("can't go above the root directory")
+            self.cwd = self.cwd.parent
+        else:
+            self.cwd = self.add_dir(name)
+
+    def add_dir(self, name: str) -> TrackedDir:
+        # listing a directory again keeps what's already known about it
+        if name not in self.cwd.dirs:
+            new_dir = TrackedDir(name, self.cwd)
+            self.cwd.dirs[name] = new_dir
+            self.all_dirs.append(new_dir)
+            self._sorted_sizes = None
+        return self.cwd.dirs[name]
+
+    def add_file(self, file: Tuple[int, str]):
+        size, name = file
+        delta = size - self.cwd.files.get(name, 0)
+        self.cwd.files[name] = size
+        if delta != 0:
+            node = self.cwd
+            while node is not None:
+                node.size += delta
+                node = node.parent
+            self._sorted_sizes = None
+
+    def _size_index(self) -> Tuple[List[int], List[int]]:
+        # every directory's size in increasing order, plus running totals; rebuilt only after changes
+        if self._sorted_sizes is None:
+            self._sorted_sizes = sorted(d.size for d in self.all_dirs)
+            self._prefix_sums = [0, *itertools.accumulate(self._sorted_sizes)]
+        return self._sorted_sizes, self._prefix_sums
+
+    def total_at_most(self, threshold: int) -> int:
+        sizes, prefix_sums = self._size_index()
+        return prefix_sums[bisect.bisect_right(sizes, threshold)]
+
+    def smallest_at_least(self, needed: int) -> Optional[int]:
+        sizes, _ = self._size_index()
+        i = bisect.bisect_left(sizes, needed)
+        return sizes[i] if i < len(sizes) else None
+
+
+def build_filesystem(lines: Iterable[str]) -> FileSystem:
+    fs = FileSystem()
+    for i, line in enumerate(lines):
+        if (result := try_cd(line)) is not None:
+            fs.cd(result)
+        elif try_ls(line):
+            pass  # the listing lines that follow are handled on their own
+        elif (result := try_dir(line)) is not None:
+            fs.add_dir(result)
+        elif (result := try_file(line)) is not None:
+            fs.add_file(result)
+        else:
+            raise ValueError(f"unknown command, line {i}: {line}")
+    return fs
+
+
+def main1_tree(fs: FileSystem) -> int:
+    return fs.total_at_most(THRESHOLD)
+
+
+def main2_tree(fs: FileSystem) -> int:
+    unused = TOTAL - fs.root.size
+    additional_needed = TOTAL_NEEDED - unused
+    if additional_needed <= 0:
+        return 0
+    if (size := fs.smallest_at_least(additional_needed)) is None:
+        raise ValueError(f"no directory is big enough to free {additional_needed}")
+    return size
+
+
+class DirTable:
+    # columnar directory table: row i is one directory, with its parent's row, its interned name, and the
+    # sizes of the files directly in it; files themselves are never stored. Parents always come before
+    # their children, so row order is a topological order of the tree
+    ROOT = 0
+
+    def __init__(self):
+        self.names: List[str] = ["/"]
+        self._name_ids: Dict[str, int] = {"/": 0}
+        self.name_ids = array("q", [0])
+        self.parents = array("q", [-1])
+        self.own_sizes = array("q", [0])
+        self._children: Dict[Tuple[int, int], int] = {}  # (parent row, name id) -> row
+        self._listed: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def child(self, parent: int, name: str) -> int:
+        name_id = self._name_ids.setdefault(name, len(self.names))
+        if name_id == len(self.names):
+            self.names.append(name)
+        key = (parent, name_id)
+        if key not in self._children:
+            self._children[key] = len(self.parents)
+            self.name_ids.append(name_id)
+            self.parents.append(parent)
+            self.own_sizes.append(0)
+        return self._children[key]
+
+    def total_sizes(self) -> array:
+        # one sweep in reverse row order adds each directory's total into its parent's
+        totals = array("q", self.own_sizes)
+        for row in range(len(totals) - 1, 0, -1):
+            totals[self.parents[row]] += totals[row]
+        return totals
+
+    @classmethod
+    def from_transcript(cls, lines: Iterable[str]) -> 'DirTable':
+        table = cls()
+        cwd = cls.ROOT
+        skip_listing = False  # a directory listed twice would otherwise count its files twice
+        for i, line in enumerate(lines):
+            if line.startswith("$"):
+                skip_listing = False
+                if (result := try_cd(line)) is not None:
+                    if result == "/":
+                        cwd = cls.ROOT
+                    elif result == "..":
+                        cwd = table.parents[cwd]
+                        if cwd < 0:
+                            raise ValueError(f"can't go above the root directory, line {i}")
+                    else:
+                        cwd = table.child(cwd, result)
+                elif try_ls(line):
+                    skip_listing = cwd in table._listed
+                    table._listed.add(cwd)
+                else:
+                    raise ValueError(f"unknown command, line {i}: {line}")
+            elif skip_listing:
+                continue
+            elif (result := try_dir(line)) is not None:
+                table.child(cwd, result)
+            elif (result := try_file(line)) is not None:
+                table.own_sizes[cwd] += result[0]
+            else:
+                raise ValueError(f"unknown command, line {i}: {line}")
+        return table
+
+
+def main1_table(totals: Sequence[int]) -> int:
+    return sum(size for size in totals if size <= THRESHOLD)
+
+
+def main2_table(totals: Sequence[int]) -> int:
+    unused = TOTAL - totals[DirTable.ROOT]
+    additional_needed = TOTAL_NEEDED - unused
+    if additional_needed <= 0:
+        return 0
+    return min(size for size in totals if size >= additional_needed)
+
+
+def parse_input(raw: str) -> List[str]:
+    return split_lines(raw)
+
+
+def _part_1(lines: List[str], state: Dict[str, Any]) -> int:
+    ans, state["root"] = main1(lines)
+    return ans
+
+
+# part 2 reuses the tree part 1 built
+SEPARABLE = False
+PARTS: Dict[str, Callable[[List[str], Dict[str, Any]], Any]] = {
+    "part 1": _part_1,
+    "part 2": lambda _, state: main2(state["root"]),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    ans, root_ = main1(lines_)
-    print("part 1:", ans)
-    ans = main2(root_)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
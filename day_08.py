@@ -1,9 +1,13 @@
+from __future__ import annotations
+
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List, Tuple
 
-import numpy as np
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+np = lazy_module("numpy")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-08.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -46,6 +50,34 @@ def main1(forest: List[List[int]]) -> int:
     return visible.sum()
 
 
+def parse_grid(data: bytes) -> np.ndarray:
+    # one uint8 height per tree; rows are the non-empty lines of the input
+    rows = data.split()
+    grid = np.frombuffer(b"".join(rows), dtype=np.uint8).reshape(len(rows), -1)
+    return grid - ord("0")
+
+
+def _visible_from_start(grid: np.ndarray) -> np.ndarray:
+    # a tree is visible from the left if it's taller than the running max of everything before it in its row
+    visible = np.ones(grid.shape, dtype=bool)
+    tallest_before = np.maximum.accumulate(grid[:, :-1], axis=1)
+    visible[:, 1:] = grid[:, 1:] > tallest_before
+    return visible
+
+
+def visible_numpy(grid: np.ndarray) -> np.ndarray:
+    # the other three directions are the same check on flipped / transposed views, flipped back after
+    visible = _visible_from_start(grid)
+    visible |= _visible_from_start(grid[:, ::-1])[:, ::-1]
+    visible |= _visible_from_start(grid.T).T
+    visible |= _visible_from_start(grid.T[:, ::-1])[:, ::-1].T
+    return visible
+
+
+def main1_numpy(grid: np.ndarray) -> int:
+    return int(visible_numpy(grid).sum())
+
+
 def score(forest: List[List[int]], row: int, col: int) -> int:
     n_rows = len(forest)
     n_cols = len(forest[0])
@@ -89,10 +121,59 @@ def main2(forest: List[List[int]]) -> int:
     return highest
 
 
+def _viewing_distances(grid: np.ndarray) -> np.ndarray:
+    # how far each tree can see towards the start of its row: a stack of earlier trees in the row, kept in
+    # non-increasing height order, so the first one left after popping the shorter ones is the blocker
+    distances = np.empty(grid.shape, dtype=np.int64)
+    for r, row in enumerate(grid.tolist()):
+        stack: List[int] = []
+        out = [0] * len(row)
+        for c, height in enumerate(row):
+            while len(stack) > 0 and row[stack[-1]] < height:
+                stack.pop()
+            out[c] = c - stack[-1] if len(stack) > 0 else c
+            stack.append(c)
+        distances[r] = out
+    return distances
+
+
+def scenic_scores(grid: np.ndarray) -> np.ndarray:
+    # each direction is the same sweep on a flipped / transposed view, flipped back after
+    scores = _viewing_distances(grid)
+    scores *= _viewing_distances(grid[:, ::-1])[:, ::-1]
+    scores *= _viewing_distances(grid.T).T
+    scores *= _viewing_distances(grid.T[:, ::-1])[:, ::-1].T
+    return scores
+
+
+def top_scenic(scores: np.ndarray, k: int) -> List[Tuple[int, int, int]]:
+    # the k best (score, row, col), best first
+    flat = scores.ravel()
+    k = min(k, flat.size)
+    if k <= 0:
+        return []
+    best = np.argpartition(flat, flat.size - k)[flat.size - k:]
+    best = best[np.argsort(flat[best], kind="stable")[::-1]]
+    rows, cols = np.unravel_index(best, scores.shape)
+    return [(int(flat[i]), int(r), int(c)) for i, r, c in zip(best, rows, cols)]
+
+
+def main2_stack(grid: np.ndarray) -> int:
+    return int(scenic_scores(grid).max())
+
+
+def parse_input(raw: str) -> List[List[int]]:
+    return [list(map(int, line)) for line in split_lines(raw)]
+
+
+PARTS: Dict[str, Callable[[List[List[int]], Dict[str, Any]], Any]] = {
+    "part 1": lambda forest, _: int(main1(forest)),
+    "part 2": lambda forest, _: main2(forest),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        forest_ = [list(map(int, line_.strip())) for line_ in f.readlines()]
-    ans = main1(forest_)
-    print("part 1:", ans)
-    ans = main2(forest_)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
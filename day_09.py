@@ -1,7 +1,12 @@
+from array import array
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
+
+np = lazy_module("numpy")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-09.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -60,11 +65,70 @@ def main(steps: List[Tuple[str, int]], *, n_knots: int = 2) -> int:
     return len(tail_visited)
 
 
+# positions are packed into one unsigned 64-bit int: x in the high 32 bits, y in the low 32, both offset
+OFFSET = 1 << 31
+
+
+def pack(x: int, y: int) -> int:
+    return ((x + OFFSET) << 32) | (y + OFFSET)
+
+
+def main_lengths(steps: List[Tuple[str, int]], lengths: Iterable[int]) -> Dict[int, int]:
+    # knot i follows the same path whatever comes behind it, so simulating the longest rope once gives
+    # the tail of every shorter rope too. Knots live in two flat lists of coordinates; each step stops
+    # propagating at the first knot that doesn't move, since nothing behind it can move either
+    lengths = sorted(set(lengths))
+    if len(lengths) == 0:
+        return {}
+    if lengths[0] < 1:
+        raise ValueError(f"a rope needs at least one knot, got {lengths[0]}")
+    n_knots = lengths[-1]
+    tails = [length - 1 for length in lengths]  # ascending knot indices
+    xs = [0] * n_knots
+    ys = [0] * n_knots
+    # each tail's positions as it moves, repeats and all
+    visited = {tail: array("Q", [pack(0, 0)]) for tail in tails}
+    for direction, step_count in steps:
+        dx, dy = Knot.DIRECTIONS[direction]
+        for _ in range(step_count):
+            xs[0] += dx
+            ys[0] += dy
+            moved = n_knots  # knots [0, moved) moved this step
+            for i in range(1, n_knots):
+                x_diff = xs[i - 1] - xs[i]
+                y_diff = ys[i - 1] - ys[i]
+                if -1 <= x_diff <= 1 and -1 <= y_diff <= 1:
+                    moved = i
+                    break
+                xs[i] += (x_diff > 0) - (x_diff < 0)
+                ys[i] += (y_diff > 0) - (y_diff < 0)
+            for tail in tails:
+                if tail >= moved:
+                    break
+                visited[tail].append(pack(xs[tail], ys[tail]))
+    return {
+        tail + 1: int(np.unique(np.frombuffer(positions, dtype=np.uint64)).size)
+        for tail, positions in visited.items()
+    }
+
+
+def main_array(steps: List[Tuple[str, int]], *, n_knots: int = 2) -> int:
+    return main_lengths(steps, (n_knots,))[n_knots]
+
+
+def parse_input(raw: str) -> List[Tuple[str, int]]:
+    steps = [line.split() for line in split_lines(raw)]
+    return [(direction, int(count)) for direction, count in steps]
+
+
+PARTS: Dict[str, Callable[[List[Tuple[str, int]], Dict[str, Any]], Any]] = {
+    "part 1": lambda steps, _: main(steps, n_knots=2),
+    "part 2": lambda steps, _: main(steps, n_knots=10),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        steps_ = [line_.strip().split() for line_ in f.readlines()]
-    steps_ = [(direction_, int(count)) for direction_, count in steps_]
-    ans = main(steps_, n_knots=2)
-    print("part 1:", ans)
-    ans = main(steps_, n_knots=10)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,7 +1,14 @@
+from __future__ import annotations
+
+from collections import Counter
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+np = lazy_module("numpy")
 
 N_ROWS = 6
 N_COLS = 40
@@ -15,50 +22,167 @@ def check_cycle(cycle: int) -> bool:
     return (cycle - 20) % 40 == 0
 
 
-def cycle_to_row_col(cycle: int) -> Tuple[int, int]:
+def cycle_to_row_col(cycle: int, *, n_rows: int = N_ROWS, n_cols: int = N_COLS) -> Tuple[int, int]:
     cycle = cycle - 1
-    row = (cycle // N_COLS) % N_ROWS
-    col = cycle % N_COLS
+    row = (cycle // n_cols) % n_rows
+    col = cycle % n_cols
     return row, col
 
 
-def try_draw(screen: List[List[str]], x: int, cycle: int):
-    row, col = cycle_to_row_col(cycle)
+def try_draw(screen: List[List[str]], x: int, cycle: int, *, n_rows: int = N_ROWS, n_cols: int = N_COLS):
+    row, col = cycle_to_row_col(cycle, n_rows=n_rows, n_cols=n_cols)
     if abs(x - col) <= 1:
         screen[row][col] = "#"
 
 
-def main(lines: List[str]) -> Tuple[int, List[List[str]]]:
+def run_cpu(lines: Iterable[str]) -> Iterator[Tuple[int, int]]:
+    # (cycle, X during that cycle), one instruction read at a time
     cycle = 0
     x = 1
-    total_strength = 0
-    screen = [
-        ["." for _ in range(N_COLS)]
-        for _ in range(N_ROWS)
-    ]
     for line in lines:
         if line == "noop":
             cycle += 1
-            try_draw(screen, x, cycle)
-            if check_cycle(cycle):
-                total_strength += cycle * x
+            yield cycle, x
         elif line.startswith("addx"):
-            for _ in range(2):
-                cycle += 1
-                try_draw(screen, x, cycle)
-                if check_cycle(cycle):
-                    total_strength += cycle * x
+            cycle += 1
+            yield cycle, x
+            cycle += 1
+            yield cycle, x
             x += int(line[5:])
         else:
             raise ValueError(f"bad line: {line}")
-    return total_strength, screen
+
+
+# called with (cycle, x) for every cycle
+Observer = Callable[[int, int], None]
+ObserverT = TypeVar("ObserverT", bound=Observer)
+
+
+class SignalStrength:
+    def __init__(self, sample: Callable[[int], bool] = check_cycle):
+        self.sample = sample
+        self.total = 0
+
+    def __call__(self, cycle: int, x: int):
+        if self.sample(cycle):
+            self.total += cycle * x
+
+
+class Crt:
+    def __init__(self, n_rows: int = N_ROWS, n_cols: int = N_COLS):
+        self.n_rows = n_rows
+        self.n_cols = n_cols
+        self.screen = [
+            ["." for _ in range(n_cols)]
+            for _ in range(n_rows)
+        ]
+
+    def __call__(self, cycle: int, x: int):
+        try_draw(self.screen, x, cycle, n_rows=self.n_rows, n_cols=self.n_cols)
+
+
+class RegisterHistogram:
+    def __init__(self):
+        self.counts: Counter = Counter()  # X value -> number of cycles it was held for
+
+    def __call__(self, cycle: int, x: int):
+        self.counts[x] += 1
+
+
+class Emulator:
+    def __init__(self, lines: Iterable[str]):
+        self.lines = lines
+        self.observers: List[Observer] = []
+
+    def register(self, observer: ObserverT) -> ObserverT:
+        self.observers.append(observer)
+        return observer
+
+    def run(self) -> int:
+        # one pass over the program feeds every observer; returns the number of cycles run
+        cycle = 0
+        observers = self.observers
+        for cycle, x in run_cpu(self.lines):
+            for observer in observers:
+                observer(cycle, x)
+        return cycle
+
+
+def main(lines: Iterable[str]) -> Tuple[int, List[List[str]]]:
+    emulator = Emulator(lines)
+    strength = emulator.register(SignalStrength())
+    crt = emulator.register(Crt())
+    emulator.run()
+    return strength.total, crt.screen
+
+
+def compile_trace(lines: Iterable[str]) -> np.ndarray:
+    # X during every cycle (index 0 is cycle 1): each instruction holds the value from before it for as many
+    # cycles as it takes, so it's the running sum of the addx values repeated by instruction durations
+    durations = []
+    deltas = []
+    for line in lines:
+        if line == "noop":
+            durations.append(1)
+            deltas.append(0)
+        elif line.startswith("addx"):
+            durations.append(2)
+            deltas.append(int(line[5:]))
+        else:
+            raise ValueError(f"bad line: {line}")
+    x_before = np.empty(len(deltas), dtype=np.int64)
+    if len(deltas) > 0:
+        x_before[0] = 1
+        np.cumsum(deltas[:-1], out=x_before[1:])
+        x_before[1:] += 1
+    return np.repeat(x_before, durations)
+
+
+def signal_strength(trace: np.ndarray, cycles: Optional[Sequence[int]] = None) -> int:
+    # by default, sample the same cycles as `check_cycle`
+    if cycles is None:
+        cycles = np.arange(20, len(trace) + 1, 40)
+    cycles = np.asarray(cycles, dtype=np.int64)
+    out_of_range = cycles[(cycles < 1) | (cycles > len(trace))]
+    if len(out_of_range) > 0:
+        raise ValueError(f"sample cycles must be in 1..{len(trace)}, got {out_of_range.tolist()}")
+    return int((cycles * trace[cycles - 1]).sum())
+
+
+def render(trace: np.ndarray, *, n_rows: int = N_ROWS, n_cols: int = N_COLS) -> np.ndarray:
+    # lit pixels as a bool frame; programs longer than one frame wrap around and draw over it, like `try_draw`
+    cols = np.arange(len(trace)) % n_cols
+    lit = np.abs(trace - cols) <= 1
+    frame_size = n_rows * n_cols
+    lit = np.pad(lit, (0, -len(lit) % frame_size))
+    return lit.reshape(-1, n_rows, n_cols).any(axis=0)
+
+
+def main_numpy(lines: Iterable[str], *, n_rows: int = N_ROWS, n_cols: int = N_COLS) -> Tuple[int, List[List[str]]]:
+    trace = compile_trace(lines)
+    frame = render(trace, n_rows=n_rows, n_cols=n_cols)
+    screen = np.where(frame, "#", ".").tolist()
+    return signal_strength(trace), screen
+
+
+def parse_input(raw: str) -> List[str]:
+    return split_lines(raw)
+
+
+def _part_2(lines: List[str], _) -> str:
+    _, screen = main(lines)
+    return "\n".join("".join(row) for row in screen)
+
+
+PARTS: Dict[str, Callable[[List[str], Dict[str, Any]], Any]] = {
+    "part 1": lambda lines, _: main(lines)[0],
+    "part 2": _part_2,
+}
 
 
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    ans, drawing_ = main(lines_)
-    print("part 1:", ans)
+    lines_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    print("part 1:", PARTS["part 1"](lines_, state_))
     print("part 2:")
-    for row_ in drawing_:
-        print("".join(row_))
+    print(PARTS["part 2"](lines_, state_))
@@ -3,9 +3,10 @@ import re
 from collections import deque
 from functools import reduce
 from pathlib import Path
-from typing import Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-11.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -40,11 +41,22 @@ def parse_operation(operation_spec: OperationSpec) -> Callable[[int], int]:
 class Monkey:
     def __init__(self, items: List[int], operation_spec: OperationSpec, div_test: int, true_dest: int, false_dest: int):
         self._items = deque(items)
+        self._operation_spec = operation_spec
         self._operation = parse_operation(operation_spec)
         self._div_test = div_test
         self._true_dest = true_dest
         self._false_dest = false_dest
 
+    def __getstate__(self) -> dict:
+        # the operation is a lambda, which can't be pickled; it gets rebuilt from its spec instead
+        state = self.__dict__.copy()
+        del state["_operation"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._operation = parse_operation(self._operation_spec)
+
     @property
     def n_items(self) -> int:
         return len(self._items)
@@ -112,12 +124,23 @@ def main(monkeys: List[Monkey], *, n_rounds: int = 20, reduction: Callable[[int]
     return a * b
 
 
+def parse_input(raw: str) -> List[Monkey]:
+    return parse(raw.strip())
+
+
+def _part_2(monkeys: List[Monkey], _) -> int:
+    mod_n = reduce((lambda x, y: x * y), (monkey.divisor for monkey in monkeys))
+    return main(monkeys, n_rounds=10000, reduction=lambda x: x % mod_n)
+
+
+PARTS: Dict[str, Callable[[List[Monkey], Dict[str, Any]], Any]] = {
+    "part 1": lambda monkeys, _: main(monkeys, n_rounds=20, reduction=lambda x: x // 3),
+    "part 2": _part_2,
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        raw = f.read().strip()
-    monkeys_ = parse(raw)
-    ans = main(monkeys_, n_rounds=20, reduction=lambda x: x // 3)
-    print("part 1:", ans)
-    mod_n = reduce((lambda x, y: x * y), (m.divisor for m in monkeys_))
-    ans = main(monkeys_, n_rounds=10000, reduction=lambda x: x % mod_n)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,9 +1,13 @@
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Callable, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
-import numpy as np
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+np = lazy_module("numpy")
 
 StepCheck = Callable[[int, int], bool]
 EndCheck = Callable[[Tuple[int, int]], bool]
@@ -81,21 +85,38 @@ def main(
         q = new_q
 
 
-if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    grid_, start_, end_ = parse(lines_)
-    ans = main(
-        grid_,
-        start_,
+def parse_input(raw: str) -> Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]]:
+    return parse(split_lines(raw))
+
+
+def _part_1(parsed: Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]], _) -> int:
+    grid, start, end = parsed
+    return main(
+        grid,
+        start,
         step_check=(lambda cur_lev, next_lev: next_lev - cur_lev <= 1),
-        end_check=(lambda pos_: pos_ == end_),
+        end_check=(lambda pos: pos == end),
     )
-    print("part 1:", ans)
-    ans = main(
-        grid_,
-        end_,
+
+
+def _part_2(parsed: Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]], _) -> int:
+    grid, _, end = parsed
+    return main(
+        grid,
+        end,
         step_check=(lambda cur_lev, next_lev: cur_lev - next_lev <= 1),
-        end_check=(lambda pos_: grid_[pos_] == LOWEST),
+        end_check=(lambda pos: grid[pos] == LOWEST),
     )
-    print("part 2:", ans)
+
+
+PARTS: Dict[str, Callable[[Tuple[np.ndarray, Tuple[int, int], Tuple[int, int]], Dict[str, Any]], Any]] = {
+    "part 1": _part_1,
+    "part 2": _part_2,
+}
+
+
+if __name__ == "__main__":
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,9 +1,10 @@
 import copy
 import json
 from pathlib import Path
-from typing import Any, Callable, List, TypeVar, Union, Optional
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 Packet = List[Union[int, List]]
 
@@ -257,11 +258,18 @@ def main2(packets: List[Packet]) -> int:
     return a * b
 
 
+def parse_input(raw: str) -> List[Packet]:
+    return [json.loads(line) for line in split_lines(raw) if line != ""]
+
+
+PARTS: Dict[str, Callable[[List[Packet], Dict[str, Any]], Any]] = {
+    "part 1": lambda packets, _: main1(packets),
+    "part 2": lambda packets, _: main2(packets),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    packets_ = [json.loads(line_) for line_ in lines_ if line_ != ""]
-    ans = main1(packets_)
-    print("part 1:", ans)
-    ans = main2(packets_)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
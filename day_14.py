@@ -1,8 +1,9 @@
 import copy
 from pathlib import Path
-from typing import Dict, List, Literal, Tuple
+from typing import Any, Callable, Dict, List, Literal, Tuple
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-14.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -124,12 +125,19 @@ def main(cave: Cave, *, floor_terminates) -> int:
     return count
 
 
+def parse_input(raw: str) -> Cave:
+    return parse(split_lines(raw))
+
+
+PARTS: Dict[str, Callable[[Cave, Dict[str, Any]], Any]] = {
+    "part 1": lambda cave, _: main(cave, floor_terminates=True),
+    "part 2": lambda cave, _: main(cave, floor_terminates=False),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    cave_ = parse(lines_)
+    cave_ = parse_input(read_text(INPUT_PATH))
     cave_.draw()
-    ans = main(cave_, floor_terminates=True)
-    print("part 1:", ans)
-    ans = main(cave_, floor_terminates=False)
-    print("part 2:", ans)
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(cave_, state_))
@@ -1,10 +1,12 @@
 import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
-import z3
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+z3 = lazy_module("z3")
 
 EXAMPLE = False
 if EXAMPLE:
@@ -74,11 +76,18 @@ def main2(data: List[Tuple[int, int, int, int]]) -> int:
     return (x * 4000000) + y
 
 
+def parse_input(raw: str) -> List[Tuple[int, int, int, int]]:
+    return parse(split_lines(raw))
+
+
+PARTS: Dict[str, Callable[[List[Tuple[int, int, int, int]], Dict[str, Any]], Any]] = {
+    "part 1": lambda data, _: main1(data),
+    "part 2": lambda data, _: main2(data),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    data_ = parse(lines_)
-    ans = main1(data_)
-    print("part 1:", ans)
-    ans = main2(data_)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -2,9 +2,11 @@ import copy
 import heapq
 import re
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional, Iterable
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from constants import INPUTS_DIR, UTF_8
+import instrument
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-16.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -199,6 +201,9 @@ def main(flows: Dict[str, int], adj: Dict[str, Set[str]]) -> int:
         unopened=set(flows.keys()),
     ))]
     while len(heap) > 0:
+        if instrument.ENABLED:
+            instrument.count("day_16b.popped")
+            instrument.observe("day_16b.heap", len(heap))
         state = heapq.heappop(heap).val
         score = state.score_hypothetical()
         if score <= best_score:
@@ -214,11 +219,17 @@ def main(flows: Dict[str, int], adj: Dict[str, Set[str]]) -> int:
     return best_score
 
 
+def parse_input(raw: str) -> Tuple[Dict[str, int], Dict[str, Set[str]]]:
+    return parse(split_lines(raw))
+
+
+PARTS: Dict[str, Callable[[Tuple[Dict[str, int], Dict[str, Set[str]]], Dict[str, Any]], Any]] = {
+    "part 2": lambda parsed, _: main(*parsed),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    flows_, adj_ = parse(lines_)
-    ans = main(flows_, adj_)
-    print("part 2:", ans)
-    # ans = main2(lines_)
-    # print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,9 +1,15 @@
+from __future__ import annotations
+
+import functools
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
-import numpy as np
+import instrument
+from constants import INPUTS_DIR
+from input_loader import read_text
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+np = lazy_module("numpy")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-17.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -14,30 +20,36 @@ WIDTH = 7
 LEFT_START_GAP = 2
 BOTTOM_START_GAP = 3
 
-SHAPES = [
-    np.array([
+SHAPE_ROWS = [
+    [
         [True, True, True, True]
-    ]),
-    np.array([
+    ],
+    [
         [False, True, False],
         [True, True, True],
         [False, True, False],
-    ]),
-    np.array([
+    ],
+    [
         [False, False, True],
         [False, False, True],
         [True, True, True],
-    ]),
-    np.array([
+    ],
+    [
         [True], [True], [True], [True]
-    ]),
-    np.array([
+    ],
+    [
         [True, True],
         [True, True],
-    ]),
+    ],
 ]
-N_SHAPES = len(SHAPES)
-BIGGEST_SHAPE_HEIGHT = max(a.shape[0] for a in SHAPES)
+N_SHAPES = len(SHAPE_ROWS)
+BIGGEST_SHAPE_HEIGHT = max(len(rows) for rows in SHAPE_ROWS)
+
+
+@functools.cache
+def get_shapes() -> List[np.ndarray]:
+    # built on first use so that importing this module doesn't import numpy
+    return [np.array(rows) for rows in SHAPE_ROWS]
 
 
 def has_overlap(canvas: np.ndarray, cur_shape: np.ndarray, bottom_edge: int, h_shift: int) -> bool:
@@ -51,11 +63,16 @@ def has_overlap(canvas: np.ndarray, cur_shape: np.ndarray, bottom_edge: int, h_s
 
 
 def bfs(canvas: np.ndarray) -> int:
+    if instrument.ENABLED:
+        instrument.count("day_17.bfs.calls")
     start = (BOTTOM_START_GAP - 1, WIDTH // 2)
     q = {start}
     visited = set()
     deepest = None
     while len(q) > 0:
+        if instrument.ENABLED:
+            instrument.count("day_17.bfs.expanded", len(q))
+            instrument.observe("day_17.bfs.frontier", len(q))
         new_q = set()
         for loc in q:
             visited.add(loc)
@@ -98,8 +115,9 @@ def main(instructions: str, *, n_rocks: int):
     highest = 0
     n_landed = 0
     n_trimmed = 0
+    shapes = get_shapes()
     # first rock
-    cur_shape = SHAPES[n_landed % N_SHAPES]
+    cur_shape = shapes[n_landed % N_SHAPES]
     h_shift = LEFT_START_GAP
     bottom_edge = highest + BOTTOM_START_GAP
     # watch for repeats
@@ -171,7 +189,7 @@ def main(instructions: str, *, n_rocks: int):
                 else:  # not a repeat
                     state_cache[state_key] = state
             # get a new rock
-            cur_shape = SHAPES[n_landed % N_SHAPES]
+            cur_shape = shapes[n_landed % N_SHAPES]
             h_shift = LEFT_START_GAP
             bottom_edge = highest + BOTTOM_START_GAP
         else:  # normal fall
@@ -180,10 +198,18 @@ def main(instructions: str, *, n_rocks: int):
         index_instruction = (index_instruction + 1) % n_instructions
 
 
+def parse_input(raw: str) -> str:
+    return raw.strip()
+
+
+PARTS: Dict[str, Callable[[str, Dict[str, Any]], Any]] = {
+    "part 1": lambda data, _: main(data, n_rocks=2022),
+    "part 2": lambda data, _: main(data, n_rocks=1000000000000),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        data_ = f.read().strip()
-    ans = main(data_, n_rocks=2022)
-    print("part 1:", ans)
-    ans = main(data_, n_rocks=1000000000000)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
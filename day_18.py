@@ -1,10 +1,12 @@
 from collections import deque
 from pathlib import Path
-from typing import Iterable, List, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
 
-import numpy as np
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+np = lazy_module("numpy")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-18.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -83,11 +85,25 @@ def main2(blob: Set[Point], n_faces_open: int) -> int:
     return n_faces_external
 
 
+def parse_input(raw: str) -> Set[Point]:
+    return parse(split_lines(raw))
+
+
+def _part_1(blob: Set[Point], state: Dict[str, Any]) -> int:
+    state["n_faces_open"] = main(blob)
+    return state["n_faces_open"]
+
+
+# part 2 starts from part 1's answer
+SEPARABLE = False
+PARTS: Dict[str, Callable[[Set[Point], Dict[str, Any]], Any]] = {
+    "part 1": _part_1,
+    "part 2": lambda blob, state: main2(blob, state["n_faces_open"]),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    blob_ = parse(lines_)
-    answer1 = main(blob_)
-    print("part 1:", answer1)
-    answer2 = main2(blob_, answer1)
-    print("part 2:", answer2)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
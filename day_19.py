@@ -1,11 +1,14 @@
 import copy
 import math
 import re
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from constants import INPUTS_DIR, UTF_8
+import instrument
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-19.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -129,6 +132,7 @@ def get_max_geodes(blueprint: Blueprint, *, n_minutes: int) -> int:
     mines = [start_state]
     states_seen = {start_state.to_tuple()}
     for cur_minute in range(1, n_minutes + 1):
+        minute_start = time.perf_counter() if instrument.ENABLED else 0.0
         mines_new = []
         states_seen_new = set()
         for mine in mines:
@@ -147,6 +151,12 @@ def get_max_geodes(blueprint: Blueprint, *, n_minutes: int) -> int:
             raise RuntimeError("ALGORITHM ERROR: no options")
         mines = mines_new
         states_seen.update(states_seen_new)
+        if instrument.ENABLED:
+            instrument.count(f"day_19.minute_{cur_minute:02}.frontier", len(mines))
+            instrument.add_seconds(f"day_19.minute_{cur_minute:02}", time.perf_counter() - minute_start)
+            instrument.count("day_19.states_expanded", len(mines))
+            instrument.observe("day_19.frontier", len(mines))
+            instrument.observe("day_19.states_seen", len(states_seen))
     return max(mine.n_geo for mine in mines)
 
 
@@ -166,11 +176,18 @@ def main2(blueprints: List[Blueprint], *, n_minutes: int) -> int:
     return math.prod(values)
 
 
+def parse_input(raw: str) -> List[Blueprint]:
+    return parse(split_lines(raw))
+
+
+PARTS: Dict[str, Callable[[List[Blueprint], Dict[str, Any]], Any]] = {
+    "part 1": lambda blueprints, _: main1(blueprints, n_minutes=24),
+    "part 2": lambda blueprints, _: main2(blueprints[:3], n_minutes=32),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    blueprints_ = parse(lines_)
-    ans = main1(blueprints_, n_minutes=24)
-    print("part 1:", ans)
-    ans = main2(blueprints_[:3], n_minutes=32)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,9 +1,11 @@
 from pathlib import Path
-from typing import List, TypedDict
+from typing import Any, Callable, Dict, List, TypedDict
 
-from tqdm import tqdm
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
+from lazy_import import lazy_module
 
-from constants import INPUTS_DIR, UTF_8
+tqdm = lazy_module("tqdm")
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-20.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -50,7 +52,7 @@ def move_backward(mixer: List[Datum], d: Datum, n_moves: int):
 def main(data: List[int], *, n_rounds: int = 1) -> int:
     n = len(data)
     mixer = list(({"val": val, "index": i} for i, val in enumerate(data)))
-    for _ in tqdm(range(n_rounds)):
+    for _ in tqdm.tqdm(range(n_rounds)):
         for d in mixer:
             val = d["val"]
             index = d["index"]
@@ -78,14 +80,18 @@ def main(data: List[int], *, n_rounds: int = 1) -> int:
     )
 
 
+def parse_input(raw: str) -> List[int]:
+    return [int(line) for line in split_lines(raw)]
+
+
+PARTS: Dict[str, Callable[[List[int], Dict[str, Any]], Any]] = {
+    "part 1": lambda data, _: main(data, n_rounds=1),
+    "part 2": lambda data, _: main([num * 811589153 for num in data], n_rounds=10),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        data_ = [int(line_.strip()) for line_ in f.readlines()]
-    ans = main(data_, n_rounds=1)
-    print("part 1:", ans)
-    data_2 = [
-        num * 811589153
-        for num in data_
-    ]
-    ans = main(data_2, n_rounds=10)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,8 +1,9 @@
 import copy
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Any, Callable, Dict, List, Tuple, Union
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-21.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -139,11 +140,25 @@ def main2(data: Dict[str, Union[int, Tuple[str, str, str]]], cache: Dict[str, in
     return needed_val
 
 
+def parse_input(raw: str) -> Dict[str, Union[int, Tuple[str, str, str]]]:
+    return parse(split_lines(raw))
+
+
+def _part_1(data: Dict[str, Union[int, Tuple[str, str, str]]], state: Dict[str, Any]) -> int:
+    ans, state["cache"] = main1(data)
+    return ans
+
+
+# part 2 reuses the values part 1 worked out
+SEPARABLE = False
+PARTS: Dict[str, Callable[[Dict[str, Union[int, Tuple[str, str, str]]], Dict[str, Any]], Any]] = {
+    "part 1": _part_1,
+    "part 2": lambda data, state: main2(data, state["cache"]),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    data_ = parse(lines_)
-    ans, cache_ = main1(data_)
-    print("part 1:", ans)
-    ans = main2(data_, cache_)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
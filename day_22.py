@@ -1,9 +1,10 @@
 import re
 from enum import IntEnum
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-22.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -206,17 +207,25 @@ def main2(maze: List[str], instructions: List[str]) -> int:
     return score_position(row, col, d)
 
 
-if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        maze_, instructions_ = f.read().split("\n\n")
-    maze_ = maze_.split("\n")
-    maze_width = max(len(row_) for row_ in maze_)
-    maze_ = [
-        row_ + (" " * (maze_width - len(row_)))
-        for row_ in maze_
+def parse_input(raw: str) -> Tuple[List[str], List[str]]:
+    maze, instructions = raw.split("\n\n")
+    maze = maze.split("\n")
+    maze_width = max(len(row) for row in maze)
+    maze = [
+        row + (" " * (maze_width - len(row)))
+        for row in maze
     ]
-    instructions_ = re.findall(r"\d+|[LR]", instructions_.strip())
-    ans = main(maze_, instructions_)
-    print("part 1:", ans)
-    ans = main2(maze_, instructions_)
-    print("part 2:", ans)
+    return maze, re.findall(r"\d+|[LR]", instructions.strip())
+
+
+PARTS: Dict[str, Callable[[Tuple[List[str], List[str]], Dict[str, Any]], Any]] = {
+    "part 1": lambda parsed, _: main(*parsed),
+    "part 2": lambda parsed, _: main2(*parsed),
+}
+
+
+if __name__ == "__main__":
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
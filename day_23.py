@@ -1,9 +1,10 @@
 import sys
 from collections import Counter
 from pathlib import Path
-from typing import List, Set, Tuple, Iterable
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 Point = Tuple[int, int]
 
@@ -123,11 +124,18 @@ def main(elves: Set[Point], *, n_rounds: int = None) -> int:
     return n_empty
 
 
+def parse_input(raw: str) -> Set[Point]:
+    return parse(split_lines(raw))
+
+
+PARTS: Dict[str, Callable[[Set[Point], Dict[str, Any]], Any]] = {
+    "part 1": lambda elves, _: main(elves, n_rounds=10),
+    "part 2": lambda elves, _: main(elves),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    elves_ = parse(lines_)
-    ans = main(elves_, n_rounds=10)
-    print("part 1:", ans)
-    ans = main(elves_)
-    print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,7 +1,9 @@
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from constants import INPUTS_DIR, UTF_8
+import instrument
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 Point = Tuple[int, int]
 Field = List[List[Optional[List[str]]]]
@@ -96,6 +98,9 @@ class FieldSystem:
             raise IndexError(f"cannot get negative index: {index}")
         index %= self.n_steps_cycle  # the system is cyclical
         n_steps_missing = 1 + index - len(self.order)
+        if instrument.ENABLED:
+            instrument.count("day_24.fields.lookups")
+            instrument.count("day_24.fields.steps_computed", max(0, n_steps_missing))
         if n_steps_missing > 0:
             # iteratively calculate more steps
             cur = self.order[-1]
@@ -152,16 +157,31 @@ def main(fields: FieldSystem, skip_steps: int = 0, start: Point = START, end: Po
             raise RuntimeError("ALGORITHM ERROR: dead end")
         historical.update(new_locs)
         locs = new_locs  # prep next step
+        if instrument.ENABLED:
+            instrument.count("day_24.bfs.expanded", len(locs))
+            instrument.observe("day_24.bfs.frontier", len(locs))
+
+
+def parse_input(raw: str) -> FieldSystem:
+    return FieldSystem(parse(split_lines(raw)))
+
+
+def _leg(fields: FieldSystem, state: Dict[str, Any], key: str, **kwargs) -> int:
+    state[key] = main(fields, **kwargs)
+    return state[key]
+
+
+# each leg of the trip starts when the previous one ended
+SEPARABLE = False
+PARTS: Dict[str, Callable[[FieldSystem, Dict[str, Any]], Any]] = {
+    "part 1": lambda fields, state: _leg(fields, state, "there"),
+    "part 1.5": lambda fields, state: _leg(fields, state, "back", skip_steps=state["there"], start=END, end=START),
+    "part 2": lambda fields, state: _leg(fields, state, "again", skip_steps=state["back"]),
+}
 
 
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    field_ = parse(lines_)
-    fields_ = FieldSystem(field_)
-    answer1 = main(fields_)
-    print("part 1:", answer1)
-    answer2_half = main(fields_, skip_steps=answer1, start=END, end=START)
-    print("part 1.5:", answer2_half)
-    answer2 = main(fields_, skip_steps=answer2_half)
-    print("part 2:", answer2)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-25.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -61,8 +62,17 @@ def main(lines: List[str]) -> str:
     return decimal_to_snafu(total)
 
 
+def parse_input(raw: str) -> List[str]:
+    return split_lines(raw)
+
+
+PARTS: Dict[str, Callable[[List[str], Dict[str, Any]], Any]] = {
+    "part 1": lambda lines, _: main(lines),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    ans = main(lines_)
-    print(ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))
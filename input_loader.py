@@ -0,0 +1,100 @@
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+from constants import UTF_8
+
+PathLike = Union[str, Path]
+LINE_SEP = b"\n"
+# a blank line, with or without CRLF line endings (text-mode `open` used to hide the `\r`s)
+BLOCK_SEP = re.compile(rb"\r?\n\r?\n")
+
+
+@contextmanager
+def open_mapped(path: PathLike) -> Iterator[Union[mmap.mmap, bytes]]:
+    # read-only view of the whole file; the OS pages it in as it's read instead of it being loaded up front
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # empty files can't be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _iter_chunks(path: PathLike, sep: bytes) -> Iterator[bytes]:
+    # each chunk is copied out of the mapping as it's reached; only one chunk is held in memory at a time
+    with open_mapped(path) as mm:
+        size = len(mm)
+        start = 0
+        while start < size:
+            end = mm.find(sep, start)
+            if end == -1:
+                end = size
+            yield mm[start:end]
+            start = end + len(sep)
+
+
+def _iter_lines(path: PathLike) -> Iterator[bytes]:
+    # lines without their line ending, `\n` or `\r\n`
+    for line in _iter_chunks(path, LINE_SEP):
+        yield line[:-1] if line.endswith(b"\r") else line
+
+
+def iter_byte_lines(path: PathLike, *, strip: bool = True) -> Iterator[bytes]:
+    for line in _iter_lines(path):
+        yield line.strip() if strip else line
+
+
+def iter_lines(path: PathLike, *, strip: bool = True) -> Iterator[str]:
+    # same lines as `[line.strip() for line in f.readlines()]`, without holding the whole file;
+    # `strip=False` keeps leading and trailing whitespace (other than the line ending itself)
+    for line in _iter_lines(path):
+        line = line.decode(UTF_8)
+        yield line.strip() if strip else line
+
+
+def iter_blocks(path: PathLike) -> Iterator[str]:
+    # same blocks as `f.read().split("\n\n")`, minus trailing newlines; leading whitespace in lines is kept
+    with open_mapped(path) as mm:
+        start = 0
+        for match in BLOCK_SEP.finditer(mm):
+            yield from _decode_block(mm[start:match.start()])
+            start = match.end()
+        yield from _decode_block(mm[start:])
+
+
+def _decode_block(block: bytes) -> Iterator[str]:
+    block = block.decode(UTF_8).replace("\r\n", "\n").rstrip("\n")
+    if block != "":
+        yield block
+
+
+def iter_ints(path: PathLike) -> Iterator[int]:
+    # one integer per line; `int` parses the bytes directly, so no `str` is built per line
+    for line in _iter_chunks(path, LINE_SEP):
+        line = line.strip()
+        if len(line) > 0:
+            yield int(line)
+
+
+def iter_int_rows(path: PathLike, sep: Optional[str] = None) -> Iterator[Tuple[int, ...]]:
+    # a row of integers per line, split on `sep` (any whitespace by default)
+    sep_bytes = None if sep is None else sep.encode(UTF_8)
+    for line in _iter_chunks(path, LINE_SEP):
+        line = line.strip()
+        if len(line) > 0:
+            yield tuple(map(int, line.split(sep_bytes)))
+
+
+def split_lines(text: str) -> List[str]:
+    # stripped lines of already-read text, e.g. from `read_text`
+    return [line.strip() for line in text.strip().split("\n")]
+
+
+def read_text(path: PathLike) -> str:
+    # `\r\n` becomes `\n`, as reading in text mode would do
+    with open_mapped(path) as mm:
+        return mm[:].decode(UTF_8).replace("\r\n", "\n")
@@ -0,0 +1,86 @@
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+from lazy_import import lazy_module
+
+# only needed once profiling is actually requested
+cProfile = lazy_module("cProfile")
+pstats = lazy_module("pstats")
+
+ENV_VAR = "AOC_INSTRUMENT"
+
+# hooks in the day modules are written as `if instrument.ENABLED: instrument.count(...)`,
+# so the only cost while this is off is one attribute lookup
+ENABLED = os.environ.get(ENV_VAR, "") not in ("", "0")
+
+_counts: Dict[str, int] = defaultdict(int)
+_maxima: Dict[str, int] = {}
+_seconds: Dict[str, float] = defaultdict(float)
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+
+def reset():
+    _counts.clear()
+    _maxima.clear()
+    _seconds.clear()
+
+
+def count(name: str, n: int = 1):
+    _counts[name] += n
+
+
+def observe(name: str, value: int):
+    # keeps the largest value seen, e.g. for frontier or heap sizes
+    if name not in _maxima or value > _maxima[name]:
+        _maxima[name] = value
+
+
+def add_seconds(name: str, seconds: float):
+    _seconds[name] += seconds
+
+
+@contextmanager
+def timer(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_seconds(name, time.perf_counter() - start)
+
+
+def snapshot() -> Dict[str, float]:
+    report: Dict[str, float] = dict(_counts)
+    report.update((f"{name} (max)", value) for name, value in _maxima.items())
+    report.update((f"{name} (s)", value) for name, value in _seconds.items())
+    return dict(sorted(report.items()))
+
+
+def profile(fn: Callable[[], Any], path: Path) -> Any:
+    # run `fn` under cProfile and dump the stats to `path` (load them with `pstats.Stats(path)`)
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn)
+    finally:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        profiler.dump_stats(tmp_path)
+        # atomic, so workers profiling the same step (e.g. each split part's parse) never clobber a half-written dump
+        os.replace(tmp_path, path)
+
+
+def print_stats(path: Path, *, limit: int = 20, sort_key: str = "cumulative"):
+    pstats.Stats(str(path), stream=sys.stdout).sort_stats(sort_key).print_stats(limit)
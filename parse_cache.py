@@ -0,0 +1,62 @@
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from constants import UTF_8
+
+CACHE_DIR = Path(".parse_cache")
+
+_MISS = object()
+
+
+def cache_path(day: str, parse_version: int, raw: str, cache_dir: Path = CACHE_DIR) -> Path:
+    # keyed by the exact input contents, so edited or generated inputs never hit a stale entry
+    digest = hashlib.sha256(raw.encode(UTF_8)).hexdigest()
+    return cache_dir / f"{day}-v{parse_version}-{digest}.pickle"
+
+
+def load(path: Path) -> Any:
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return _MISS
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError, ValueError) as e:
+        print(f"WARNING: ignoring unreadable parse cache entry {path}: {e!r}", file=sys.stderr)
+        return _MISS
+
+
+def store(path: Path, parsed: Any) -> bool:
+    try:
+        payload = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        print(f"WARNING: can't cache parsed input for {path.name}: {e!r}", file=sys.stderr)
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)  # atomic, so parallel workers never see a half-written entry
+    return True
+
+
+def cached_parse(
+        day: str,
+        parse_version: int,
+        raw: str,
+        parse: Callable[[], Any],
+        *,
+        cache_dir: Optional[Path] = CACHE_DIR,
+) -> Any:
+    # `cache_dir=None` disables the cache
+    if cache_dir is None:
+        return parse()
+    path = cache_path(day, parse_version, raw, cache_dir)
+    parsed = load(path)
+    if parsed is _MISS:
+        parsed = parse()
+        store(path, parsed)
+    return parsed
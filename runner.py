@@ -0,0 +1,238 @@
+import argparse
+import functools
+import importlib
+import json
+import math
+import re
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from constants import INPUTS_DIR
+import instrument
+from input_loader import read_text
+from parse_cache import CACHE_DIR, cached_parse
+
+DAY_MODULE_RE = re.compile(r"day_(\d\d)\w*")
+PARSE = "parse"
+
+# parsed input, plus state shared between the parts of one run -> answer
+Part = Callable[[Any, Dict[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class DaySpec:
+    # read off the day module: `INPUT_PATH`, `parse_input`, `PARTS`, and optionally `SEPARABLE` / `PARSE_VERSION`
+    input_file: str
+    parse: Callable[[str], Any]
+    parts: Dict[str, Part]
+    separable: bool = True  # False if later parts read `state` written by earlier ones
+    parse_version: int = 1  # bump whenever the day's parse output changes, to invalidate cached parses
+
+
+@dataclass
+class PartResult:
+    day: str
+    part: str
+    answer: str
+    seconds: float
+    peak_bytes: Optional[int]
+    counters: Dict[str, float] = field(default_factory=dict)  # from `instrument`, when it's enabled
+
+
+@functools.cache
+def day_spec(name: str) -> Optional[DaySpec]:
+    # None for modules that don't define the runner interface
+    module = importlib.import_module(name)
+    if not hasattr(module, "parse_input") or not hasattr(module, "PARTS"):
+        return None
+    return DaySpec(
+        input_file=module.INPUT_PATH.name,
+        parse=module.parse_input,
+        parts=module.PARTS,
+        separable=getattr(module, "SEPARABLE", True),
+        parse_version=getattr(module, "PARSE_VERSION", 1),
+    )
+
+
+def discover_days(root: Path = Path(".")) -> List[str]:
+    names = sorted(path.stem for path in root.glob("day_*.py") if DAY_MODULE_RE.fullmatch(path.stem))
+    for name in names:
+        if day_spec(name) is None:
+            print(f"WARNING: module {name} has no `parse_input` / `PARTS`; skipping it", file=sys.stderr)
+    return [name for name in names if day_spec(name) is not None]
+
+
+def select_days(requested: Iterable[str], available: List[str]) -> List[str]:
+    # "7" or "07" selects every module for that day (e.g. day_16 and day_16b); full module names also work
+    selected = []
+    for req in requested:
+        if req.isdigit():
+            matches = [name for name in available if int(DAY_MODULE_RE.fullmatch(name).group(1)) == int(req)]
+        else:
+            matches = [name for name in available if name == req]
+        if len(matches) == 0:
+            raise ValueError(f"no day module matches {req!r}")
+        selected.extend(name for name in matches if name not in selected)
+    return selected
+
+
+def measure(fn: Callable[[], Any], *, trace_memory: bool = True) -> Tuple[Any, float, Optional[int]]:
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = fn()
+    finally:
+        seconds = time.perf_counter() - start
+        peak = None
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return result, seconds, peak
+
+
+def read_input(spec: DaySpec, inputs_dir: Path = Path(INPUTS_DIR)) -> str:
+    return read_text(inputs_dir / spec.input_file)
+
+
+def format_answer(answer: Any) -> str:
+    return "" if answer is None else str(answer)
+
+
+def _run_step(
+        name: str,
+        step: str,
+        fn: Callable[[], Any],
+        *,
+        trace_memory: bool,
+        profile_dir: Optional[Path],
+) -> Tuple[Any, PartResult]:
+    if profile_dir is not None:
+        fn = functools.partial(instrument.profile, fn, profile_dir / f"{name}-{step.replace(' ', '_')}.pstats")
+    if instrument.ENABLED:
+        instrument.reset()
+    result, seconds, peak = measure(fn, trace_memory=trace_memory)
+    counters = instrument.snapshot() if instrument.ENABLED else {}
+    return result, PartResult(name, step, "", seconds, peak, counters)
+
+
+def run_day(
+        name: str,
+        *,
+        parts: Optional[Iterable[str]] = None,
+        inputs_dir: Path = Path(INPUTS_DIR),
+        raw: Optional[str] = None,
+        trace_memory: bool = True,
+        cache_dir: Optional[Path] = None,
+        instrumented: bool = False,
+        profile_dir: Optional[Path] = None,
+) -> List[PartResult]:
+    # `raw` overrides the input file (e.g. for generated inputs); `cache_dir` enables the parsed-input cache;
+    # `instrumented` collects the counters/timers from `instrument`; `profile_dir` gets a cProfile dump per step
+    spec = day_spec(name)
+    if spec is None:
+        raise ValueError(f"module {name} has no `parse_input` / `PARTS`")
+    if raw is None:
+        raw = read_input(spec, inputs_dir)
+    # `instrument.ENABLED` is process-wide, so put it back afterwards for whatever runs next in this process
+    was_enabled = instrument.ENABLED
+    if instrumented:
+        instrument.enable()
+    try:
+        parsed, result = _run_step(
+            name,
+            PARSE,
+            lambda: cached_parse(name, spec.parse_version, raw, lambda: spec.parse(raw), cache_dir=cache_dir),
+            trace_memory=trace_memory,
+            profile_dir=profile_dir,
+        )
+        results = [result]
+        state: Dict[str, Any] = {}
+        wanted = set(spec.parts) if parts is None else set(parts)
+        for part_name, part in spec.parts.items():
+            if part_name not in wanted:
+                continue
+            answer, result = _run_step(
+                name,
+                part_name,
+                lambda: part(parsed, state),
+                trace_memory=trace_memory,
+                profile_dir=profile_dir,
+            )
+            result.answer = format_answer(answer)
+            results.append(result)
+    finally:
+        if not was_enabled:
+            instrument.disable()
+    return results
+
+
+def _format_bytes(n_bytes: Optional[int]) -> str:
+    if n_bytes is None:
+        return "-"
+    units = ["B", "KiB", "MiB", "GiB"]
+    power = min(len(units) - 1, int(math.log(max(n_bytes, 1), 1024)))
+    return f"{n_bytes / 1024 ** power:.1f} {units[power]}"
+
+
+def format_table(results: List[PartResult]) -> str:
+    rows = [("day", "part", "time (s)", "peak mem", "answer")]
+    continuation = {}  # row index -> extra lines (e.g. the day 10 CRT, or instrument counters)
+    for result in results:
+        first, *rest = result.answer.split("\n")
+        rest.extend(f"{counter}: {value:g}" for counter, value in result.counters.items())
+        rows.append((result.day, result.part, f"{result.seconds:.4f}", _format_bytes(result.peak_bytes), first))
+        if len(rest) > 0:
+            continuation[len(rows) - 1] = rest
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]) - 1)]
+    indent = sum(widths) + 2 * len(widths)
+    out = []
+    for i, row in enumerate(rows):
+        out.append("  ".join(cell.ljust(width) for cell, width in zip(row, widths)) + "  " + row[-1])
+        out.extend(" " * indent + line for line in continuation.get(i, []))
+    total = sum(result.seconds for result in results)
+    out.append(f"total: {total:.4f} s")
+    return "\n".join(out)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run and time the day modules")
+    parser.add_argument("days", nargs="*", help="day numbers (e.g. 7) or module names (e.g. day_16b); default all")
+    parser.add_argument("--json", action="store_true", help="print results as JSON instead of a table")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc peak-memory tracking (faster)")
+    parser.add_argument("--inputs-dir", type=Path, default=Path(INPUTS_DIR))
+    parser.add_argument("--cache", action="store_true", help="reuse parsed inputs cached by earlier runs")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR)
+    parser.add_argument("--instrument", action="store_true",
+                        help=f"report hot-path counters and timers (same as setting {instrument.ENV_VAR}=1)")
+    parser.add_argument("--profile-dir", type=Path, help="dump cProfile stats for every parse and part here")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> List[PartResult]:
+    args = build_arg_parser().parse_args(argv)
+    available = discover_days()
+    names = available if len(args.days) == 0 else select_days(args.days, available)
+    results = []
+    for name in names:
+        results.extend(run_day(
+            name,
+            inputs_dir=args.inputs_dir,
+            trace_memory=not args.no_memory,
+            cache_dir=args.cache_dir if args.cache else None,
+            instrumented=args.instrument,
+            profile_dir=args.profile_dir,
+        ))
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        print(format_table(results))
+    return results
+
+
+if __name__ == "__main__":
+    main()
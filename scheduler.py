@@ -0,0 +1,149 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import instrument
+from constants import INPUTS_DIR, UTF_8
+from runner import PARSE, PartResult, build_arg_parser, day_spec, discover_days, format_table, run_day, select_days
+
+TIMINGS_PATH = Path("timings.json")
+
+# one unit of work: a day module plus the parts to run in that process (None = all of them)
+Task = Tuple[str, Optional[Tuple[str, ...]]]
+
+
+def timing_key(day: str, part: str) -> str:
+    return f"{day}/{part}"
+
+
+def load_timings(path: Path = TIMINGS_PATH) -> Dict[str, float]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding=UTF_8) as f:
+        return json.load(f)
+
+
+def save_timings(results: List[PartResult], path: Path = TIMINGS_PATH):
+    timings = load_timings(path)
+    for result in results:
+        timings[timing_key(result.day, result.part)] = result.seconds
+    with open(path, "w", encoding=UTF_8) as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def make_tasks(names: List[str], *, split_parts: bool = True) -> List[Task]:
+    tasks = []
+    for name in names:
+        spec = day_spec(name)
+        if split_parts and spec.separable and len(spec.parts) > 1:
+            tasks.extend((name, (part,)) for part in spec.parts)
+        else:
+            tasks.append((name, None))
+    return tasks
+
+
+def estimate(task: Task, timings: Dict[str, float]) -> float:
+    name, parts = task
+    if parts is None:
+        parts = tuple(day_spec(name).parts)
+    total = timings.get(timing_key(name, PARSE), 0.0)
+    for part in parts:
+        key = timing_key(name, part)
+        if key not in timings:
+            return float("inf")  # never timed; assume it's slow so it isn't left for last
+        total += timings[key]
+    return total
+
+
+def order_longest_first(tasks: List[Task], timings: Dict[str, float]) -> List[Task]:
+    return sorted(tasks, key=lambda task: estimate(task, timings), reverse=True)
+
+
+def _run_task(task: Task, options: Dict[str, Any]) -> List[PartResult]:
+    name, parts = task
+    return run_day(name, parts=parts, **options)
+
+
+def sort_results(results: List[PartResult]) -> List[PartResult]:
+    # deterministic output regardless of completion order: day order, then parse, then parts in spec order
+    def key(result: PartResult) -> Tuple[str, int]:
+        parts = [PARSE, *day_spec(result.day).parts]
+        return result.day, parts.index(result.part)
+
+    return sorted(results, key=key)
+
+
+def run_parallel(
+        names: List[str],
+        *,
+        jobs: Optional[int] = None,
+        split_parts: bool = True,
+        timings: Optional[Dict[str, float]] = None,
+        inputs_dir: Path = Path(INPUTS_DIR),
+        trace_memory: bool = True,
+        cache_dir: Optional[Path] = None,
+        instrumented: bool = False,
+        profile_dir: Optional[Path] = None,
+) -> List[PartResult]:
+    tasks = order_longest_first(make_tasks(names, split_parts=split_parts), timings or {})
+    options = dict(
+        inputs_dir=inputs_dir,
+        trace_memory=trace_memory,
+        cache_dir=cache_dir,
+        instrumented=instrumented,
+        profile_dir=profile_dir,
+    )
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_run_task, task, options) for task in tasks]
+        batches = [future.result() for future in futures]
+    results = []
+    parsed_days = set()
+    for batch in batches:
+        for result in batch:
+            # split parts each parse on their own; only report the first parse of each day
+            if result.part == PARSE:
+                if result.day in parsed_days:
+                    continue
+                parsed_days.add(result.day)
+            results.append(result)
+    return sort_results(results)
+
+
+def main(argv: Optional[List[str]] = None) -> List[PartResult]:
+    parser = build_arg_parser()
+    parser.description = "Run the day modules in parallel, longest-first"
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--no-split", action="store_true", help="keep all the parts of a day in one process")
+    parser.add_argument("--timings", type=Path, default=TIMINGS_PATH, help="recorded timings used for ordering")
+    parser.add_argument("--no-save-timings", action="store_true", help="don't update the timings file afterwards")
+    args = parser.parse_args(argv)
+    available = discover_days()
+    names = available if len(args.days) == 0 else select_days(args.days, available)
+    results = run_parallel(
+        names,
+        jobs=args.jobs,
+        split_parts=not args.no_split,
+        timings=load_timings(args.timings),
+        inputs_dir=args.inputs_dir,
+        trace_memory=not args.no_memory,
+        cache_dir=args.cache_dir if args.cache else None,
+        instrumented=args.instrument,
+        profile_dir=args.profile_dir,
+    )
+    # counters and cProfile slow the days down, so those timings would skew the longest-first order of later runs
+    instrumented = args.instrument or args.profile_dir is not None or instrument.ENABLED
+    if not args.no_save_timings and not instrumented:
+        save_timings(results, args.timings)
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        print(format_table(results))
+    return results
+
+
+if __name__ == "__main__":
+    main()
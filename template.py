@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List
 
-from constants import INPUTS_DIR, UTF_8
+from constants import INPUTS_DIR
+from input_loader import read_text, split_lines
 
 INPUT_PATH = Path(INPUTS_DIR) / "day-00.txt"
 # INPUT_PATH = Path(INPUTS_DIR) / "example.txt"
@@ -11,10 +12,18 @@ def main(lines: List[str]):
     pass  # TODO
 
 
+def parse_input(raw: str) -> List[str]:
+    return split_lines(raw)
+
+
+PARTS: Dict[str, Callable[[List[str], Dict[str, Any]], Any]] = {
+    "part 1": lambda lines, _: main(lines),
+    # "part 2": lambda lines, _: main2(lines),
+}
+
+
 if __name__ == "__main__":
-    with open(INPUT_PATH, "r", encoding=UTF_8) as f:
-        lines_ = [line_.strip() for line_ in f.readlines()]
-    ans = main(lines_)
-    print("part 1:", ans)
-    # ans = main2(lines_)
-    # print("part 2:", ans)
+    parsed_ = parse_input(read_text(INPUT_PATH))
+    state_ = {}
+    for part_name_, part_ in PARTS.items():
+        print(f"{part_name_}:", part_(parsed_, state_))